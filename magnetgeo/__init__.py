@@ -11,229 +11,340 @@ This version includes the refactored component structure:
 - Legacy classes still available at root level for backward compatibility
 """
 
+import importlib
+import importlib.util
 import os
+import sys
 import warnings
+from functools import cache, partial
+from types import MappingProxyType, ModuleType
+from typing import Dict, Optional, Tuple
 
 # Package metadata
 __version__ = "0.5.0"  # Major update for new component structure
 __author__ = "Christophe Trophime, Romain Vallet, Jeremie Muzet"
 __email__ = "christophe.trophime@lncmi.cnrs.fr"
 
-# Import main magnet classes from new location
-try:
-    from .components.magnet import Helix, Bitter, Supra
-    NEW_MAGNET_STRUCTURE = True
-    print("✓ Using new magnet component structure")
-except ImportError:
-    # Fallback to old imports for transition
+# Environment-driven behaviour, read once at import
+_MODE = {
+    "verbose": os.environ.get("MAGNETGEO_VERBOSE") == "1",
+    "warnings": os.environ.get("MAGNETGEO_SHOW_WARNINGS") == "1",
+}
+
+# Public names resolved on first attribute access (PEP 562).
+# Each name maps to the modules probed, in order, to provide it:
+# new component layout first, then legacy root-level modules.
+_PROBE_ORDER = {
+    # Magnet classes
+    "Helix": ("magnetgeo.components.magnet", "magnetgeo.Helix"),
+    "Bitter": ("magnetgeo.components.magnet", "magnetgeo.Bitter"),
+    "Supra": ("magnetgeo.components.magnet", "magnetgeo.Supra"),
+    # Structural classes
+    "Ring": ("magnetgeo.components.structural", "magnetgeo.Ring"),
+    "Screen": ("magnetgeo.components.structural", "magnetgeo.Screen"),
+    "InnerCurrentLead": ("magnetgeo.components.structural", "magnetgeo.InnerCurrentLead"),
+    "OuterCurrentLead": ("magnetgeo.components.structural", "magnetgeo.OuterCurrentLead"),
+    # Support classes
+    "Chamfer": ("magnetgeo.components.support", "magnetgeo.Chamfer"),
+    "Groove": ("magnetgeo.components.support", "magnetgeo.Groove"),
+    "Model3D": ("magnetgeo.components.support", "magnetgeo.Model3D"),
+    "ModelAxi": ("magnetgeo.components.support", "magnetgeo.ModelAxi"),
+    "CoolingSlit": ("magnetgeo.components.support", "magnetgeo.coolingslit"),
+    "Tierod": ("magnetgeo.components.support", "magnetgeo.tierod"),
+    "Shape": ("magnetgeo.components.support", "magnetgeo.Shape"),
+    "Shape2D": ("magnetgeo.components.support", "magnetgeo.Shape2D"),
+    # Remaining classes (not yet moved)
+    "Insert": ("magnetgeo.Insert",),
+    "Bitters": ("magnetgeo.Bitters",),
+    "Supras": ("magnetgeo.Supras",),
+    "MSite": ("magnetgeo.MSite",),
+    # YAML compatibility
+    "setup_yaml_compatibility": ("magnetgeo.yaml_compatibility",),
+    "ensure_yaml_compatibility": ("magnetgeo.yaml_compatibility",),
+    # Submodules
+    "support": ("magnetgeo.components.support",),
+    "validation": ("magnetgeo.utils.validation",),
+    "enums": ("magnetgeo.utils.enums",),
+}
+
+# Submodule names exposed as modules rather than as module attributes
+_MODULE_NAMES = ("support", "validation", "enums")
+
+# Import attempts memoized per module path (None when the import failed)
+_RESOLVED: Dict[str, Optional[ModuleType]] = {}
+
+# Marks public names that no module in _PROBE_ORDER provides
+_MISSING = object()
+
+# Resolution results memoized per public name (module or _MISSING)
+_PROVIDERS: Dict[str, object] = {}
+
+# Names already warned about being resolved from a legacy module
+_WARNED = set()
+
+# Cached status functions, cleared whenever a new lazy import resolves
+_STATUS_CACHES = []
+
+# Class names per category, in reporting order
+_MAGNET_NAMES = ("Helix", "Bitter", "Supra")
+_STRUCTURAL_NAMES = ("Ring", "Screen", "InnerCurrentLead", "OuterCurrentLead")
+_SUPPORT_NAMES = (
+    "Chamfer", "Groove", "Model3D", "ModelAxi",
+    "CoolingSlit", "Tierod", "Shape", "Shape2D",
+)
+
+# Classes that have not been migrated to the components layout yet
+# (magnetgeo.LEGACY_CLASSES is computed on access, see _legacy_classes)
+_LEGACY_NAMES = ("Insert", "Bitters", "Supras", "MSite")
+
+
+def _module_available(module_path: str) -> bool:
+    """Check whether a module can be found without importing it"""
     try:
-        from .Helix import Helix
-        from .Bitter import Bitter
-        from .Supra import Supra
-        NEW_MAGNET_STRUCTURE = False
-        print("⚠ Using legacy magnet classes (consider upgrading)")
+        return importlib.util.find_spec(module_path) is not None
     except ImportError:
-        Helix = Bitter = Supra = None
-        NEW_MAGNET_STRUCTURE = False
-        print("✗ Magnet classes not available")
-
-# Import structural classes from new location
-try:
-    from .components.structural import Ring, Screen, InnerCurrentLead, OuterCurrentLead
-    NEW_STRUCTURAL_STRUCTURE = True
-    print("✓ Using new structural component structure")
-except ImportError:
-    # Fallback to old imports for transition
+        return False
+
+
+def _import_once(module_path: str) -> Optional[ModuleType]:
+    """Import module_path, attempting each path at most once"""
     try:
-        from .Ring import Ring
-        from .Screen import Screen
-        from .InnerCurrentLead import InnerCurrentLead
-        from .OuterCurrentLead import OuterCurrentLead
-        NEW_STRUCTURAL_STRUCTURE = False
-        print("⚠ Using legacy structural classes (consider upgrading)")
-    except ImportError:
-        Ring = Screen = InnerCurrentLead = OuterCurrentLead = None
-        NEW_STRUCTURAL_STRUCTURE = False
-        print("✗ Structural classes not available")
-
-# Import remaining classes (not yet moved)
-LEGACY_CLASSES = {}
-try:
-    from .Insert import Insert
-    LEGACY_CLASSES['Insert'] = Insert
-except ImportError:
-    Insert = None
-
-try:
-    from .Bitters import Bitters
-    LEGACY_CLASSES['Bitters'] = Bitters
-except ImportError:
-    Bitters = None
-
-try:
-    from .Supras import Supras
-    LEGACY_CLASSES['Supras'] = Supras
-except ImportError:
-    Supras = None
-
-try:
-    from .MSite import MSite
-    LEGACY_CLASSES['MSite'] = MSite
-except ImportError:
-    MSite = None
-
-# Import support classes from new location
-try:
-    from .components import support
-    NEW_SUPPORT_STRUCTURE = True
-    print("✓ Using new support component structure")
-    
-    # Make support classes available at root level for convenience
+        return _RESOLVED[module_path]
+    except KeyError:
+        pass
     try:
-        from .components.support import (
-            Chamfer, Groove, Model3D, ModelAxi, CoolingSlit, Tierod, Shape, Shape2D
-        )
+        module = importlib.import_module(module_path)
     except ImportError:
-        # Partial support import
-        Chamfer = Groove = Model3D = ModelAxi = None
-        CoolingSlit = Tierod = Shape = Shape2D = None
-        
-except ImportError:
-    # Fallback to old support imports
-    try:
-        from .backward_compatibility import (
-            Chamfer, Groove, Model3D, ModelAxi, CoolingSlit, Tierod, Shape, Shape2D
+        module = None
+    _RESOLVED[module_path] = module
+    return module
+
+
+def _invalidate_status_cache():
+    """Clear cached package status after a new class has been resolved"""
+    for func in _STATUS_CACHES:
+        func.cache_clear()
+
+
+def _resolve(name: str) -> Optional[ModuleType]:
+    """
+    Find the module providing a public name
+
+    Args:
+        name: Public name from _PROBE_ORDER
+
+    Returns:
+        First module in probe order that imports and provides name, or None
+    """
+    if name not in _PROBE_ORDER:
+        return None
+    provider = _PROVIDERS.get(name)
+    if provider is None:
+        provider = _MISSING
+        for module_path in _PROBE_ORDER[name]:
+            module = _import_once(module_path)
+            if module is None:
+                continue
+            if name in _MODULE_NAMES or getattr(module, name, None) is not None:
+                provider = module
+                break
+        _PROVIDERS[name] = provider
+    return None if provider is _MISSING else provider
+
+
+def __getattr__(name: str):
+    """Resolve public classes on first access"""
+    if name == "LEGACY_CLASSES":
+        return _legacy_classes()
+
+    module = _resolve(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    obj = module if name in _MODULE_NAMES else getattr(module, name)
+
+    # Warn once per name when only a legacy fallback module provides it
+    if module.__name__ != _PROBE_ORDER[name][0] and name not in _WARNED:
+        _WARNED.add(name)
+        warnings.warn(
+            f"magnetgeo.{name} is provided by legacy module {module.__name__}; "
+            f"use {_PROBE_ORDER[name][0]} instead",
+            DeprecationWarning,
+            stacklevel=2,
         )
-        NEW_SUPPORT_STRUCTURE = False
-        support = None
-        print("⚠ Using backward compatibility support components")
-    except ImportError:
-        # Final fallback to old individual imports
-        support = None
-        NEW_SUPPORT_STRUCTURE = False
-        try:
-            from .Chamfer import Chamfer
-            from .Groove import Groove
-            from .Model3D import Model3D
-            from .ModelAxi import ModelAxi
-            from .coolingslit import CoolingSlit
-            from .tierod import Tierod
-            from .Shape import Shape
-            from .Shape2D import Shape2D
-            print("⚠ Using legacy support components")
-        except ImportError:
-            Chamfer = Groove = Model3D = ModelAxi = None
-            CoolingSlit = Tierod = Shape = Shape2D = None
-            print("✗ Support components not available")
-
-# Import utilities if available
-try:
-    from .utils import validation, enum_types
-    UTILS_AVAILABLE = True
-except ImportError:
-    UTILS_AVAILABLE = False
-    validation = enum_types = None
-
-# Import YAML compatibility system if available
-try:
-    from .yaml_compatibility import setup_yaml_compatibility
-    YAML_COMPATIBILITY_AVAILABLE = True
-    
-    # Automatically set up YAML compatibility
-    setup_yaml_compatibility()
-    print("✓ YAML compatibility system initialized")
-    
-except ImportError:
-    YAML_COMPATIBILITY_AVAILABLE = False
-    print("⚠ YAML compatibility system not available")
-
-# Define what's available for import
-__all__ = []
-
-# Add available classes to __all__
-if Helix is not None:
-    __all__.append('Helix')
-if Bitter is not None:
-    __all__.append('Bitter')
-if Supra is not None:
-    __all__.append('Supra')
-if Ring is not None:
-    __all__.append('Ring')
-if Screen is not None:
-    __all__.append('Screen')
-if InnerCurrentLead is not None:
-    __all__.append('InnerCurrentLead')
-if OuterCurrentLead is not None:
-    __all__.append('OuterCurrentLead')
-if Insert is not None:
-    __all__.append('Insert')
-if Bitters is not None:
-    __all__.append('Bitters')
-if Supras is not None:
-    __all__.append('Supras')
-if MSite is not None:
-    __all__.append('MSite')
-
-# Add support classes if available
-support_classes = ['Chamfer', 'Groove', 'Model3D', 'ModelAxi', 'CoolingSlit', 'Tierod', 'Shape', 'Shape2D']
-for cls_name in support_classes:
-    if globals().get(cls_name) is not None:
-        __all__.append(cls_name)
-
-# Add support module if available
-if support is not None:
-    __all__.append('support')
+
+    # Cache in module globals so later lookups bypass __getattr__
+    globals()[name] = obj
+    _invalidate_status_cache()
+    return obj
+
+
+def _legacy_classes():
+    """Map each available legacy class name to its class"""
+    classes = {}
+    for name in _LEGACY_NAMES:
+        cls = _get_class(name)
+        if cls is not None:
+            classes[name] = cls
+    return classes
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_PROBE_ORDER) | {"LEGACY_CLASSES"})
+
+
+def _get_class(name: str):
+    """Return the object bound to name, or None when it cannot be resolved"""
+    try:
+        return globals()[name]
+    except KeyError:
+        pass
+    try:
+        return __getattr__(name)
+    except AttributeError:
+        return None
+
+
+# Import status messages, logged once at the end of package import
+_STATUS = []
+
+NEW_MAGNET_STRUCTURE = _module_available("magnetgeo.components.magnet")
+if NEW_MAGNET_STRUCTURE:
+    _STATUS.append("✓ Using new magnet component structure")
+elif _module_available("magnetgeo.Helix"):
+    _STATUS.append("⚠ Using legacy magnet classes (consider upgrading)")
+else:
+    _STATUS.append("✗ Magnet classes not available")
+
+NEW_STRUCTURAL_STRUCTURE = _module_available("magnetgeo.components.structural")
+if NEW_STRUCTURAL_STRUCTURE:
+    _STATUS.append("✓ Using new structural component structure")
+elif _module_available("magnetgeo.Ring"):
+    _STATUS.append("⚠ Using legacy structural classes (consider upgrading)")
+else:
+    _STATUS.append("✗ Structural classes not available")
+
+# Support module is resolved lazily on first access to magnetgeo.support
+NEW_SUPPORT_STRUCTURE = _module_available("magnetgeo.components.support")
+if NEW_SUPPORT_STRUCTURE:
+    _STATUS.append("✓ Using new support component structure")
+elif _module_available("magnetgeo.Chamfer"):
+    _STATUS.append("⚠ Using legacy support components")
+else:
+    _STATUS.append("✗ Support components not available")
+
+# Utilities (validation, enums) are resolved lazily
+UTILS_AVAILABLE = _module_available("magnetgeo.utils")
+
+# YAML compatibility is set up on first YAML load (see ensure_yaml_compatibility)
+YAML_COMPATIBILITY_AVAILABLE = _module_available("magnetgeo.yaml_compatibility")
+if YAML_COMPATIBILITY_AVAILABLE:
+    _STATUS.append("✓ YAML compatibility system available")
+else:
+    _STATUS.append("⚠ YAML compatibility system not available")
+
+# Public API (names are resolved lazily on first access)
+__all__: Tuple[str, ...] = (
+    *_MAGNET_NAMES,
+    *_STRUCTURAL_NAMES,
+    *_SUPPORT_NAMES,
+    *_MODULE_NAMES,
+)
 
 # Utility functions
+@cache
 def get_available_classes():
-    """Get list of available classes"""
+    """
+    Get available classes per category
+
+    Returns:
+        Read-only mapping of category -> {class name: available}
+    """
     available = {}
     
     # Check magnet classes
-    magnet_classes = {'Helix': Helix, 'Bitter': Bitter, 'Supra': Supra}
-    available['magnet'] = {k: v is not None for k, v in magnet_classes.items()}
+    available['magnet'] = {k: _get_class(k) is not None for k in _MAGNET_NAMES}
     
     # Check structural classes  
-    structural_classes = {
-        'Ring': Ring, 'Screen': Screen, 
-        'InnerCurrentLead': InnerCurrentLead, 'OuterCurrentLead': OuterCurrentLead
-    }
-    available['structural'] = {k: v is not None for k, v in structural_classes.items()}
+    available['structural'] = {k: _get_class(k) is not None for k in _STRUCTURAL_NAMES}
     
     # Check legacy classes
-    available['legacy'] = {k: v is not None for k, v in LEGACY_CLASSES.items()}
+    available['legacy'] = {k: v is not None for k, v in _legacy_classes().items()}
     
     # Check support classes
-    support_classes_dict = {
-        'Chamfer': Chamfer, 'Groove': Groove, 'Model3D': Model3D, 'ModelAxi': ModelAxi,
-        'CoolingSlit': CoolingSlit, 'Tierod': Tierod, 'Shape': Shape, 'Shape2D': Shape2D
-    }
-    available['support'] = {k: v is not None for k, v in support_classes_dict.items()}
+    available['support'] = {k: _get_class(k) is not None for k in _SUPPORT_NAMES}
     
-    return available
+    return MappingProxyType(
+        {category: MappingProxyType(classes) for category, classes in available.items()}
+    )
+
+@cache
+def get_package_info():
+    """
+    Get package information
+
+    Returns:
+        Read-only mapping with version, structure flags and available classes
+    """
+    return MappingProxyType({
+        "version": __version__,
+        "new_magnet_structure": NEW_MAGNET_STRUCTURE,
+        "new_structural_structure": NEW_STRUCTURAL_STRUCTURE,
+        "new_support_structure": NEW_SUPPORT_STRUCTURE,
+        "yaml_compatibility": YAML_COMPATIBILITY_AVAILABLE,
+        "utils_available": UTILS_AVAILABLE,
+        "available_classes": get_available_classes(),
+    })
+
+_STATUS_CACHES.extend((get_available_classes, get_package_info))
+
+# Class name -> loader, built once so lookups are a single dict access
+_NAME_TO_LOADER = {
+    name: partial(_get_class, name)
+    for name in (*__all__, *_LEGACY_NAMES)
+    if name not in _MODULE_NAMES
+}
+
+
+def _no_class():
+    return None
+
+
+def get_class_by_name(class_name: str):
+    """
+    Get a magnetgeo class by name
+
+    Args:
+        class_name: Name of the class (e.g. "Helix", "Ring", "Chamfer")
+
+    Returns:
+        Class object, or None if the name is unknown or not available
+    """
+    return _NAME_TO_LOADER.get(class_name, _no_class)()
 
 def print_status():
     """Print current package status"""
-    print("\nMagnetGeo Package Status:")
-    print(f"  Version: {__version__}")
-    print(f"  New magnet structure: {NEW_MAGNET_STRUCTURE}")
-    print(f"  New structural structure: {NEW_STRUCTURAL_STRUCTURE}")
-    print(f"  New support structure: {NEW_SUPPORT_STRUCTURE}")
-    print(f"  YAML compatibility: {YAML_COMPATIBILITY_AVAILABLE}")
-    print(f"  Utils available: {UTILS_AVAILABLE}")
+    lines = [
+        "\nMagnetGeo Package Status:",
+        f"  Version: {__version__}",
+        f"  New magnet structure: {NEW_MAGNET_STRUCTURE}",
+        f"  New structural structure: {NEW_STRUCTURAL_STRUCTURE}",
+        f"  New support structure: {NEW_SUPPORT_STRUCTURE}",
+        f"  YAML compatibility: {YAML_COMPATIBILITY_AVAILABLE}",
+        f"  Utils available: {UTILS_AVAILABLE}",
+    ]
     
     available = get_available_classes()
     for category, classes in available.items():
         available_count = sum(classes.values())
         total_count = len(classes)
-        print(f"  {category.title()} classes: {available_count}/{total_count} available")
-
-# Optional: Print status when imported (can be disabled with environment variable)
-if os.environ.get('MAGNETGEO_QUIET') != '1':
-    print(f"MagnetGeo v{__version__} loaded")
+        lines.append(f"  {category.title()} classes: {available_count}/{total_count} available")
     
+    # Single write instead of one print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
 # Optional: Show warnings for missing components
-if os.environ.get('MAGNETGEO_SHOW_WARNINGS') == '1':
+if _MODE["warnings"]:
     missing_components = []
     if not NEW_MAGNET_STRUCTURE:
         missing_components.append("magnet components")
@@ -268,3 +379,11 @@ def _show_migration_notice():
 
 # Make the migration notice available but don't print it automatically
 __migration_notice__ = _show_migration_notice
+
+# Optional: Log import status (enable with MAGNETGEO_VERBOSE=1)
+if _MODE["verbose"]:
+    # logging is only needed here; importing it unconditionally is a
+    # noticeable part of the package import time
+    import logging
+
+    logging.getLogger(__name__).info("\n".join(_STATUS))
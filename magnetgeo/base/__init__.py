@@ -3,21 +3,36 @@ MagnetGeo base classes module
 
 This module provides the foundational base classes for the entire
 magnetgeo package. All component types inherit from these bases.
+
+Classes are imported from their submodules on first access.
 """
 
-from .serializable import SerializableBase
-from .geometry import GeometryMixin, CollectionGeometryMixin
-from .support_base import SupportComponentBase
-from .component_base import MagnetComponentBase
-from .structural_base import StructuralComponentBase
-from .container_base import MagnetContainerBase
-
-__all__ = [
-    'SerializableBase',
-    'GeometryMixin',
-    'CollectionGeometryMixin', 
-    'SupportComponentBase',
-    'MagnetComponentBase',
-    'StructuralComponentBase',
-    'MagnetContainerBase'
-]
+import importlib
+
+# Public class -> submodule providing it
+_MAP = {
+    'SerializableBase': '.serializable',
+    'validation_disabled': '.serializable',
+    'GeometryMixin': '.geometry',
+    'CollectionGeometryMixin': '.geometry',
+    'SupportComponentBase': '.support_base',
+    'MagnetComponentBase': '.component_base',
+    'StructuralComponentBase': '.structural_base',
+}
+
+__all__ = tuple(_MAP)
+
+
+def __getattr__(name: str):
+    """Import base classes on first access"""
+    rel = _MAP.get(name)
+    if rel is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(rel, __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MAP))
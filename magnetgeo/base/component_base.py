@@ -1,9 +1,44 @@
-from functools import cached_property
 from typing import List, Tuple, Any
 from .serializable import SerializableBase
-from .geometry import GeometryMixin
+from .geometry import GeometryMixin, _BOUNDS_VOLUMES, _PI
 from abc import ABC, abstractmethod
 
+# Classes _load_from_file() can type-check against, by name
+_MODULE_MAP = {
+    "ModelAxi": "magnetgeo.components.support.modelaxi",
+    "Model3D": "magnetgeo.components.support.model3d",
+    "Shape": "magnetgeo.components.support.shape",
+    # Add more as needed
+}
+
+# Resolved classes from _MODULE_MAP, filled on first use
+_TYPE_CACHE = {}
+
+
+class cached_property:
+    """
+    Lock-free replacement for functools.cached_property
+
+    The computed value is stored in the instance __dict__ under the same
+    name. As a non-data descriptor it is then shadowed, so later reads
+    are plain attribute lookups. Deleting the attribute forces a reload.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.attrname = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.attrname = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.attrname] = value
+        return value
+
 
 class MagnetComponentBase(SerializableBase, GeometryMixin, ABC):
     """
@@ -13,6 +48,19 @@ class MagnetComponentBase(SerializableBase, GeometryMixin, ABC):
     Examples: Helix, Bitter, Supra
     """
 
+    # Parameters stored as _<key>_data and resolved on first access
+    _LAZY_LOAD_KEYS = frozenset(
+        {
+            "shape",
+            "chamfers",
+            "grooves",
+            "coolingslits",
+            "tierod",
+            "model3d",
+            "struct",
+        }
+    )
+
     def __init__(
         self,
         name: str,
@@ -40,20 +88,22 @@ class MagnetComponentBase(SerializableBase, GeometryMixin, ABC):
         validate_string_not_empty(name, "name")
 
         self.name = name
-        self.r = r.copy()  # Defensive copy
-        self.z = z.copy()  # Defensive copy
+        # Immutable bounds: get_bounds() can hand them out without copying
+        self.r = tuple(r)
+        self.z = tuple(z)
         self.odd = bool(odd)
         self._modelaxi_data = modelaxi
 
         # Store component-specific parameters with lazy loading pattern
+        lazy = self._LAZY_LOAD_KEYS
         for key, value in kwargs.items():
-            if self._should_lazy_load(key):
+            if key in lazy:
                 setattr(self, f"_{key}_data", value)
             else:
                 setattr(self, key, value)
 
         # Call validation after initialization
-        self.validate()
+        self._validate_after_init()
 
     def _should_lazy_load(self, key: str) -> bool:
         """
@@ -65,16 +115,7 @@ class MagnetComponentBase(SerializableBase, GeometryMixin, ABC):
         Returns:
             True if parameter should be lazy-loaded
         """
-        lazy_load_keys = {
-            "shape",
-            "chamfers",
-            "grooves",
-            "coolingslits",
-            "tierod",
-            "model3d",
-            "struct",
-        }
-        return key in lazy_load_keys
+        return key in self._LAZY_LOAD_KEYS
 
     @cached_property
     def modelaxi(self) -> Any:
@@ -105,18 +146,15 @@ class MagnetComponentBase(SerializableBase, GeometryMixin, ABC):
         try:
             from ..utils.io import load_file
 
-            # Dynamically import expected type
-            module_map = {
-                "ModelAxi": "magnetgeo.components.support.modelaxi",
-                "Model3D": "magnetgeo.components.support.model3d",
-                "Shape": "magnetgeo.components.support.shape",
-                # Add more as needed
-            }
-
-            if expected_type in module_map:
-                module_path = module_map[expected_type]
+            # Dynamically import expected type, once per type
+            expected_class = _TYPE_CACHE.get(expected_type)
+            if expected_class is None and expected_type in _MODULE_MAP:
+                module_path = _MODULE_MAP[expected_type]
                 module = __import__(module_path, fromlist=[expected_type])
                 expected_class = getattr(module, expected_type)
+                _TYPE_CACHE[expected_type] = expected_class
+
+            if expected_class is not None:
                 return load_file(filepath, expected_class)
             else:
                 # Fallback - load without type checking
@@ -125,8 +163,13 @@ class MagnetComponentBase(SerializableBase, GeometryMixin, ABC):
             # Fallback if utils not available yet
             import yaml
 
+            try:
+                from yaml import CSafeLoader as SafeLoader
+            except ImportError:
+                from yaml import SafeLoader
+
             with open(filepath, "r") as f:
-                return yaml.load(f, Loader=yaml.SafeLoader)
+                return yaml.load(f, Loader=SafeLoader)
 
     # Abstract methods that concrete classes must implement
     @abstractmethod
@@ -150,14 +193,72 @@ class MagnetComponentBase(SerializableBase, GeometryMixin, ABC):
         pass
 
     # Common implementations
-    def get_bounds(self) -> Tuple[List[float], List[float]]:
+    def get_bounds(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
         """
         Return bounding box as (r, z) tuple
 
         Returns:
-            Tuple of (r_bounds, z_bounds)
+            Tuple of (r_bounds, z_bounds), each an immutable (min, max) pair
+        """
+        return (self.r, self.z)
+
+    def intersect(self, r: List[float], z: List[float]) -> bool:
+        """
+        Check if intersection with rectangle defined by r,z is non-empty
+
+        Compares against the stored bounds directly, without going
+        through get_bounds().
+
+        Args:
+            r: Radial bounds [r_min, r_max] of test rectangle
+            z: Axial bounds [z_min, z_max] of test rectangle
+
+        Returns:
+            True if objects intersect, False if no intersection
         """
-        return (self.r.copy(), self.z.copy())
+        self_r = self.r
+        self_z = self.z
+        return (
+            self_r[0] < r[1]
+            and r[0] < self_r[1]
+            and self_z[0] < z[1]
+            and z[0] < self_z[1]
+        )
+
+    def get_center(self) -> Tuple[float, float]:
+        """
+        Get geometric center of component
+
+        Returns:
+            Tuple of (r_center, z_center)
+        """
+        r = self.r
+        z = self.z
+        return ((r[0] + r[1]) / 2, (z[0] + z[1]) / 2)
+
+    def get_volume_2d(self) -> float:
+        """
+        Get 2D volume (area in r-z plane) of component
+
+        Returns:
+            Volume in cylindrical coordinates
+        """
+        r = self.r
+        z = self.z
+        return _PI * (r[1] ** 2 - r[0] ** 2) * (z[1] - z[0])
+
+    def set_bounds(self, r: List[float] = None, z: List[float] = None) -> None:
+        """
+        Replace radial and/or axial bounds
+
+        Args:
+            r: New radial bounds [r_min, r_max] (unchanged if None)
+            z: New axial bounds [z_min, z_max] (unchanged if None)
+        """
+        if r is not None:
+            self.r = tuple(r)
+        if z is not None:
+            self.z = tuple(z)
 
     def get_turns(self) -> float:
         """
@@ -205,12 +306,11 @@ class MagnetComponentBase(SerializableBase, GeometryMixin, ABC):
         # Default implementation - override in subclasses for specific behavior
         base_name = f"{prefix}{self.name}"
 
-        if self.modelaxi and hasattr(self.modelaxi, "turns"):
+        modelaxi = self.modelaxi
+        if modelaxi and hasattr(modelaxi, "turns"):
             # Generate names for each section
-            names = []
-            for i in range(len(self.modelaxi.turns)):
-                names.append(f"{base_name}_section{i}")
-            return names
+            section = f"{base_name}_section"
+            return [f"{section}{i}" for i in range(len(modelaxi.turns))]
         else:
             return [base_name]
 
@@ -230,8 +330,8 @@ class MagnetComponentBase(SerializableBase, GeometryMixin, ABC):
         # Add insulator names
         insulator_name, count = self.get_insulator_info()
         if insulator_name and count > 0:
-            for i in range(count):
-                names.append(f"{prefix}{insulator_name}{i}")
+            insulator = f"{prefix}{insulator_name}"
+            names.extend([f"{insulator}{i}" for i in range(count)])
 
         return names
 
@@ -245,3 +345,6 @@ class MagnetComponentBase(SerializableBase, GeometryMixin, ABC):
 
         # Additional validation can be added here
         # Subclasses should override and call super().validate()
+
+
+_BOUNDS_VOLUMES.add(MagnetComponentBase.get_volume_2d)
@@ -1,6 +1,41 @@
+import math
 from abc import ABC, abstractmethod
 from typing import Tuple, List
 
+_PI = math.pi
+
+# Below this many objects, NumPy setup costs more than the Python loop
+_NUMPY_MIN_OBJECTS = 8
+
+# get_volume_2d implementations that only depend on get_bounds(); the
+# vectorized get_total_volume() is used when every object has one
+_BOUNDS_VOLUMES = set()
+
+
+def _numpy_bounds(objects):
+    """
+    Stack object bounds as rows of (r_min, r_max, z_min, z_max)
+
+    Args:
+        objects: Objects implementing get_bounds()
+
+    Returns:
+        (N, 4) float64 array, or None if NumPy is unavailable or the
+        collection is too small to benefit
+    """
+    if len(objects) < _NUMPY_MIN_OBJECTS:
+        return None
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np.fromiter(
+        (v for obj in objects for pair in obj.get_bounds() for v in pair),
+        dtype=np.float64,
+        count=4 * len(objects),
+    ).reshape(-1, 4)
+
+
 class GeometryMixin(ABC):
     """
     Mixin providing common geometry operations
@@ -9,6 +44,9 @@ class GeometryMixin(ABC):
     in the magnetgeo package.
     """
     
+    # Stateless mixin: leave instance layout to subclasses
+    __slots__ = ()
+    
     @abstractmethod
     def get_bounds(self) -> Tuple[List[float], List[float]]:
         """
@@ -19,11 +57,37 @@ class GeometryMixin(ABC):
         """
         pass
     
+    def __getstate__(self):
+        """
+        Return instance state
+
+        r and z are stored as tuples but written out as lists, so YAML
+        output stays plain sequences that safe loaders can read.
+        """
+        state = self.__dict__.copy()
+        for key in ("r", "z"):
+            value = state.get(key)
+            if isinstance(value, tuple):
+                state[key] = list(value)
+        return state
+
+    def __setstate__(self, state) -> None:
+        """
+        Restore instance state produced by __getstate__, with r and z
+        stored as tuples again
+        """
+        self.__dict__.update(state)
+        for key in ("r", "z"):
+            value = state.get(key)
+            if isinstance(value, list):
+                self.__dict__[key] = tuple(value)
+
     def boundingBox(self) -> Tuple[List[float], List[float]]:
         """
         Return bounding box as (r, z) tuple
         
-        Alias for get_bounds() for backward compatibility.
+        Alias for get_bounds() for backward compatibility. Components store
+        their bounds as tuples, so the result is shared, not copied.
         
         Returns:
             Tuple of (r_bounds, z_bounds)
@@ -43,11 +107,14 @@ class GeometryMixin(ABC):
         """
         r_bounds, z_bounds = self.get_bounds()
         
-        # Check if rectangles overlap in both dimensions
-        r_overlap = r_bounds[0] < r[1] and r[0] < r_bounds[1]
-        z_overlap = z_bounds[0] < z[1] and z[0] < z_bounds[1]
-        
-        return r_overlap and z_overlap
+        # Check if rectangles overlap in both dimensions; stop at the
+        # first failing comparison
+        return (
+            r_bounds[0] < r[1]
+            and r[0] < r_bounds[1]
+            and z_bounds[0] < z[1]
+            and z[0] < z_bounds[1]
+        )
     
     def get_lc(self) -> float:
         """
@@ -90,8 +157,10 @@ class GeometryMixin(ABC):
         r_inner = r_bounds[0]
         height = z_bounds[1] - z_bounds[0]
         
-        import math
-        return math.pi * (r_outer**2 - r_inner**2) * height
+        return _PI * (r_outer**2 - r_inner**2) * height
+
+_BOUNDS_VOLUMES.add(GeometryMixin.get_volume_2d)
+
 
 class CollectionGeometryMixin(GeometryMixin):
     """
@@ -101,6 +170,8 @@ class CollectionGeometryMixin(GeometryMixin):
     hold multiple geometric objects.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_objects(self) -> List[GeometryMixin]:
         """
@@ -122,6 +193,13 @@ class CollectionGeometryMixin(GeometryMixin):
         if not objects:
             return ([0, 0], [0, 0])
         
+        # Large collections: reduce all bounds in one NumPy pass
+        bounds = _numpy_bounds(objects)
+        if bounds is not None:
+            mins = bounds.min(axis=0)
+            maxs = bounds.max(axis=0)
+            return ([float(mins[0]), float(maxs[1])], [float(mins[2]), float(maxs[3])])
+        
         # Get bounds from first object
         r_bounds, z_bounds = objects[0].get_bounds()
         r_min, r_max = r_bounds[0], r_bounds[1]
@@ -144,7 +222,19 @@ class CollectionGeometryMixin(GeometryMixin):
         Returns:
             Sum of volumes of all objects
         """
-        return sum(obj.get_volume_2d() for obj in self.get_objects())
+        objects = self.get_objects()
+        
+        # Large collections: evaluate every volume from one bounds array,
+        # unless an object computes its volume some other way
+        if len(objects) >= _NUMPY_MIN_OBJECTS and all(
+            type(obj).get_volume_2d in _BOUNDS_VOLUMES for obj in objects
+        ):
+            bounds = _numpy_bounds(objects)
+            if bounds is not None:
+                volumes = (bounds[:, 1] ** 2 - bounds[:, 0] ** 2) * (bounds[:, 3] - bounds[:, 2])
+                return _PI * float(volumes.sum())
+        
+        return sum(obj.get_volume_2d() for obj in objects)
     
     def find_overlapping_objects(self, tolerance: float = 1e-6) -> List[Tuple[GeometryMixin, GeometryMixin]]:
         """
@@ -157,18 +247,31 @@ class CollectionGeometryMixin(GeometryMixin):
             List of tuples containing overlapping object pairs
         """
         objects = self.get_objects()
-        overlapping_pairs = []
         
-        for i, obj1 in enumerate(objects):
-            for obj2 in objects[i+1:]:
-                r1, z1 = obj1.get_bounds()
-                r2, z2 = obj2.get_bounds()
-                
+        # Sweep over objects sorted by r_min, keeping only those whose
+        # radial extent still reaches the current position
+        events = []
+        for index, obj in enumerate(objects):
+            (r_min, r_max), (z_min, z_max) = obj.get_bounds()
+            events.append((r_min, r_max, z_min, z_max, index))
+        events.sort()
+        
+        active = []
+        index_pairs = []
+        for r_min, r_max, z_min, z_max, index in events:
+            # Active objects start at or before r_min, so the radial overlap
+            # is min(r_max) - r_min; drop those that can no longer overlap
+            active = [item for item in active if item[0] - r_min > tolerance]
+            
+            for other_r_max, other_z_min, other_z_max, other in active:
                 # Check for meaningful overlap (not just touching)
-                r_overlap = max(0, min(r1[1], r2[1]) - max(r1[0], r2[0]))
-                z_overlap = max(0, min(z1[1], z2[1]) - max(z1[0], z2[0]))
-                
+                r_overlap = min(r_max, other_r_max) - r_min
+                z_overlap = min(z_max, other_z_max) - max(z_min, other_z_min)
                 if r_overlap > tolerance and z_overlap > tolerance:
-                    overlapping_pairs.append((obj1, obj2))
+                    index_pairs.append((min(index, other), max(index, other)))
+            
+            active.append((r_max, z_min, z_max, index))
         
-        return overlapping_pairs
+        # Report pairs in collection order, as the pairwise scan did
+        index_pairs.sort()
+        return [(objects[i], objects[j]) for i, j in index_pairs]
@@ -1,8 +1,33 @@
-import json
-import yaml
+import os
 from abc import ABC
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Dict, Any
 
+# Whether constructors run validate(); see validation_disabled(). Kept per
+# thread/task so that disabling it in one does not affect the others.
+# MAGNETGEO_SKIP_VALIDATION=1 turns construction checks off by default.
+_VALIDATION_ENABLED: ContextVar[bool] = ContextVar(
+    "magnetgeo_validation_enabled",
+    default=os.environ.get("MAGNETGEO_SKIP_VALIDATION") != "1",
+)
+
+
+@contextmanager
+def validation_disabled():
+    """
+    Skip constructor validation inside the block
+
+    Only for trusted construction paths, e.g. rebuilding objects from
+    data this package wrote itself. Explicit validate() calls still run.
+    Only the current thread (or asyncio task) is affected.
+    """
+    token = _VALIDATION_ENABLED.set(False)
+    try:
+        yield
+    finally:
+        _VALIDATION_ENABLED.reset(token)
+
 
 class SerializableBase(ABC):
     """
@@ -12,6 +37,9 @@ class SerializableBase(ABC):
     consistent across all magnetgeo components.
     """
 
+    # Stateless mixin: leave instance layout to subclasses
+    __slots__ = ()
+
     def dump(self, format: str = "yaml") -> None:
         """
         Dump object to file in specified format
@@ -22,9 +50,19 @@ class SerializableBase(ABC):
         filename = f"{self.name}.{format}"
 
         if format == "yaml":
+            import yaml
+
+            # libyaml emitter when available (objects need the full Dumper)
+            try:
+                from yaml import CDumper as Dumper
+            except ImportError:
+                from yaml import Dumper
+
             with open(filename, "w") as f:
-                yaml.dump(self, stream=f, default_flow_style=False)
+                yaml.dump(self, stream=f, Dumper=Dumper, default_flow_style=False)
         elif format == "json":
+            import json
+
             with open(filename, "w") as f:
                 json.dump(self.to_dict(), f, indent=4, sort_keys=True)
         else:
@@ -37,6 +75,8 @@ class SerializableBase(ABC):
         Returns:
             JSON string representation
         """
+        import json
+
         return json.dumps(self.to_dict(), indent=4, sort_keys=True)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -49,11 +89,11 @@ class SerializableBase(ABC):
         Returns:
             Dictionary representation of object
         """
-        result = {}
-        for key, value in self.__dict__.items():
-            if not key.startswith("_"):
-                result[key] = value
-        return result
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if key[:1] != "_"
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any], debug: bool = False) -> "SerializableBase":
@@ -83,8 +123,18 @@ class SerializableBase(ABC):
         Returns:
             Created object instance
         """
+        import yaml
+        from ..yaml_compatibility import ensure_yaml_compatibility
+
+        # libyaml parser when available
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+
+        ensure_yaml_compatibility()
         with open(filename, "r") as f:
-            data = yaml.load(f, Loader=yaml.SafeLoader)
+            data = yaml.load(f, Loader=SafeLoader)
 
         if debug:
             print(f"Loaded YAML data from {filename}: {data}")
@@ -96,6 +146,9 @@ class SerializableBase(ABC):
         """
         Create object from JSON file
 
+        JSON parses considerably faster than YAML (orjson is used when
+        installed), so prefer it for files that are not edited by hand.
+
         Args:
             filename: Path to JSON file
             debug: Whether to print debug information
@@ -103,8 +156,25 @@ class SerializableBase(ABC):
         Returns:
             Created object instance
         """
-        with open(filename, "r") as f:
-            data = json.load(f)
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+
+        with open(filename, "rb") as f:
+            raw = f.read()
+
+        data = None
+        if orjson is not None:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # e.g. NaN/Infinity literals, which only the stdlib accepts
+                data = None
+        if data is None:
+            import json
+
+            data = json.loads(raw)
 
         if debug:
             print(f"Loaded JSON data from {filename}: {data}")
@@ -120,6 +190,19 @@ class SerializableBase(ABC):
         """
         pass
 
+    def _validate_after_init(self, **kwargs) -> None:
+        """
+        Run validate() at the end of __init__ unless disabled
+
+        Constructors call this instead of validate() so that
+        validation_disabled() can turn construction checks off.
+
+        Args:
+            **kwargs: Passed on to validate()
+        """
+        if _VALIDATION_ENABLED.get():
+            self.validate(**kwargs)
+
     def __repr__(self) -> str:
         """
         String representation of object
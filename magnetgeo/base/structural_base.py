@@ -35,16 +35,19 @@ class StructuralComponentBase(SerializableBase, GeometryMixin):
             raise ValueError("Radial coordinates must be non-negative")
 
         self.name = name
-        self.r = r.copy()  # Defensive copy
+        # Immutable bounds: get_bounds() can hand them out without copying
+        self.r = tuple(r)
 
         # Store additional parameters
         for key, value in kwargs.items():
+            if key == "z" and value is not None:
+                value = tuple(value)
             setattr(self, key, value)
 
         # Call validation after initialization
-        self.validate()
+        self._validate_after_init()
 
-    def get_bounds(self) -> Tuple[List[float], List[float]]:
+    def get_bounds(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
         """
         Return bounding box
 
@@ -52,15 +55,28 @@ class StructuralComponentBase(SerializableBase, GeometryMixin):
         Override in subclasses for custom geometry.
 
         Returns:
-            Tuple of (r_bounds, z_bounds)
+            Tuple of (r_bounds, z_bounds), each an immutable (min, max) pair
         """
-        z_bounds = getattr(self, "z", [0, 0])
+        z_bounds = getattr(self, "z", (0, 0))
 
-        # Ensure z_bounds is a valid list
-        if not isinstance(z_bounds, list) or len(z_bounds) != 2:
-            z_bounds = [0, 0]
+        # Ensure z_bounds is a valid pair
+        if not isinstance(z_bounds, (tuple, list)) or len(z_bounds) != 2:
+            z_bounds = (0, 0)
 
-        return (self.r.copy(), z_bounds)
+        return (tuple(self.r), tuple(z_bounds))
+
+    def set_bounds(self, r: List[float] = None, z: List[float] = None) -> None:
+        """
+        Replace radial and/or axial bounds
+
+        Args:
+            r: New radial bounds [r_min, r_max] (unchanged if None)
+            z: New axial bounds [z_min, z_max] (unchanged if None)
+        """
+        if r is not None:
+            self.r = tuple(r)
+        if z is not None:
+            self.z = tuple(z)
 
     def get_structural_type(self) -> str:
         """
@@ -1,8 +1,7 @@
-import json
-import yaml
+import warnings
 
 from .serializable import SerializableBase
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 
 class SupportComponentBase(SerializableBase):
@@ -13,16 +12,73 @@ class SupportComponentBase(SerializableBase):
     Examples: Chamfer, Groove, Model3D, ModelAxi, CoolingSlit, Tierod, Shape
     """
 
+    # Subclasses may declare __slots__; __getstate__/__setstate__ cover both
+    __slots__ = ()
+
     def __init__(self, name: str = ""):
         """
         Initialize support component
 
+        Subclasses call validate() once their own attributes are set.
+
         Args:
             name: Component identifier
         """
         self.name = name
-        # Call validation after initialization
-        self.validate()
+
+    @classmethod
+    def _slot_names(cls) -> Tuple[str, ...]:
+        """
+        Get instance slots declared along the MRO
+
+        Returns:
+            Tuple of slot names
+        """
+        names = []
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            names.extend(s for s in slots if s not in ("__dict__", "__weakref__"))
+        return tuple(names)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Return instance state for pickle, YAML and JSON
+
+        Combines __dict__ with the public slots of slotted subclasses;
+        private slots only hold derived caches and are left out.
+
+        Returns:
+            Dictionary of attribute values
+        """
+        state = dict(getattr(self, "__dict__", {}))
+        for name in self._slot_names():
+            if name[:1] != "_" and hasattr(self, name):
+                state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore instance state produced by __getstate__
+
+        Keys without a matching slot go to __dict__; fully slotted
+        classes have none, so such keys are skipped with a warning.
+
+        Args:
+            state: Dictionary of attribute values
+        """
+        slots = self._slot_names()
+        extra = getattr(self, "__dict__", None)
+        for key, value in state.items():
+            if key in slots:
+                object.__setattr__(self, key, value)
+            elif extra is not None:
+                extra[key] = value
+            else:
+                warnings.warn(
+                    f"{self.__class__.__name__}: ignoring unknown attribute {key!r}"
+                )
 
     def get_component_info(self) -> Dict[str, Any]:
         """
@@ -73,10 +129,18 @@ class SupportComponentBase(SerializableBase):
         Args:
             name: Optional filename override
         """
+        import yaml
+
+        # libyaml emitter when available (objects need the full Dumper)
+        try:
+            from yaml import CDumper as Dumper
+        except ImportError:
+            from yaml import Dumper
+
         filename = name or self.name
         try:
             with open(f"{filename}.yaml", "w") as ostream:
-                yaml.dump(self, stream=ostream)
+                yaml.dump(self, stream=ostream, Dumper=Dumper)
         except Exception:
             raise Exception(f"Failed to dump {self.__class__.__name__} data")
 
@@ -87,6 +151,8 @@ class SupportComponentBase(SerializableBase):
         Returns:
             JSON string representation
         """
+        import json
+
         try:
             # Try to use existing deserialize module for compatibility
             from .. import deserialize
@@ -11,61 +11,77 @@ This package contains all magnet component classes organized by type:
 - container: Container components (Insert, Bitters, Supras, MSite) [future]
 """
 
-# Import main magnet components from new location
-try:
-    from .magnet import Helix, Bitter, Supra
-    MAGNET_COMPONENTS_AVAILABLE = True
-except ImportError:
-    MAGNET_COMPONENTS_AVAILABLE = False
-    Helix = Bitter = Supra = None
-
-# Import support components
-try:
-    from . import support
-    SUPPORT_COMPONENTS_AVAILABLE = True
-except ImportError:
-    SUPPORT_COMPONENTS_AVAILABLE = False
-    support = None
-
-# Import structural components
-try:
-    from .structural import Ring, Screen, InnerCurrentLead, OuterCurrentLead
-    STRUCTURAL_COMPONENTS_AVAILABLE = True
-    
-    # Make structural components available at package level
-    __all__ = ['Ring', 'Screen', 'InnerCurrentLead', 'OuterCurrentLead']
-    
-    if MAGNET_COMPONENTS_AVAILABLE:
-        __all__.extend(['Helix', 'Bitter', 'Supra'])
-    
-    if SUPPORT_COMPONENTS_AVAILABLE:
-        __all__.append('support')
-        
-except ImportError:
-    STRUCTURAL_COMPONENTS_AVAILABLE = False
-    Ring = Screen = InnerCurrentLead = OuterCurrentLead = None
+import importlib
+from importlib.util import find_spec
+
+# Subpackages are imported on first attribute access (PEP 562); the
+# availability flags only check that they are present until the first
+# status query, which imports them and updates the flags.
+MAGNET_COMPONENTS_AVAILABLE = find_spec(f"{__name__}.magnet") is not None
+SUPPORT_COMPONENTS_AVAILABLE = find_spec(f"{__name__}.support") is not None
+STRUCTURAL_COMPONENTS_AVAILABLE = find_spec(f"{__name__}.structural") is not None
+
+# Public name -> subpackage providing it
+_MAP = {
+    'Ring': '.structural',
+    'Screen': '.structural',
+    'InnerCurrentLead': '.structural',
+    'OuterCurrentLead': '.structural',
+    'Helix': '.magnet',
+    'Bitter': '.magnet',
+    'Supra': '.magnet',
+}
+
+# Subpackages loaded as modules on first access
+_SUBPACKAGES = ('magnet', 'structural', 'support', 'hts')
+
+# Status functions, kept out of the package module until used
+_DIAGNOSTICS = ('get_component_status', 'all_components_available', 'print_component_status')
+
+_AVAILABLE = {
+    '.structural': STRUCTURAL_COMPONENTS_AVAILABLE,
+    '.magnet': MAGNET_COMPONENTS_AVAILABLE,
+}
+
+# Make available components accessible at package level
+__all__ = [name for name, rel in _MAP.items() if _AVAILABLE[rel]]
+if SUPPORT_COMPONENTS_AVAILABLE:
+    __all__.append('support')
+
+
+def __getattr__(name: str):
+    """Import components and subpackages on first access"""
+    if name in _SUBPACKAGES:
+        rel, attr = f'.{name}', None
+    elif name in _MAP:
+        rel, attr = _MAP[name], name
+    elif name in _DIAGNOSTICS:
+        rel, attr = '._diagnostics', name
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(rel, __name__)
+    except ImportError as err:
+        # A missing subpackage means the feature is unavailable; one that
+        # exists but fails to import is a real error and must surface
+        if find_spec(f"{__name__}{rel}") is not None:
+            raise ImportError(
+                f"{__name__}{rel} is present but failed to import: {err}"
+            ) from err
+        obj = None
+    else:
+        obj = module if attr is None else getattr(module, attr)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MAP) | set(_SUBPACKAGES) | set(_DIAGNOSTICS))
 
 # Future imports (placeholder for upcoming migrations)
 # from . import container
 
-# Status reporting
-def get_component_status():
-    """Get status of component imports"""
-    return {
-        'magnet_components': MAGNET_COMPONENTS_AVAILABLE,
-        'support_components': SUPPORT_COMPONENTS_AVAILABLE,
-        'structural_components': STRUCTURAL_COMPONENTS_AVAILABLE
-    }
-
-# Convenience function to check if all components are available
-def all_components_available():
-    """Check if all component types are available"""
-    status = get_component_status()
-    return all(status.values())
-
 if __name__ == "__main__":
-    print("MagnetGeo Components Status:")
-    status = get_component_status()
-    for component_type, available in status.items():
-        symbol = "✓" if available else "✗"
-        print(f"  {symbol} {component_type}: {available}")
+    from ._diagnostics import print_component_status
+
+    print_component_status()
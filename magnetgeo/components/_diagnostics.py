@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Component status reporting
+
+Loaded by magnetgeo.components on first use of one of its status
+functions, so plain package imports don't pay for it.
+"""
+
+import importlib
+import sys
+
+_package = sys.modules[__package__]
+
+
+def _resolve(flag: str, subpackage: str) -> bool:
+    """
+    Confirm an availability flag by importing its subpackage
+
+    The package only checks that subpackages are present; the first
+    status query imports them and records whether that succeeded.
+
+    Args:
+        flag: Name of the availability flag in magnetgeo.components
+        subpackage: Subpackage the flag refers to
+
+    Returns:
+        True if the subpackage imports
+    """
+    available = getattr(_package, flag)
+    if available:
+        try:
+            importlib.import_module(f".{subpackage}", __package__)
+        except ImportError:
+            available = False
+        setattr(_package, flag, available)
+    return available
+
+
+_STATUS = {
+    'magnet_components': _resolve('MAGNET_COMPONENTS_AVAILABLE', 'magnet'),
+    'support_components': _resolve('SUPPORT_COMPONENTS_AVAILABLE', 'support'),
+    'structural_components': _resolve('STRUCTURAL_COMPONENTS_AVAILABLE', 'structural'),
+}
+
+
+# Status reporting
+def get_component_status():
+    """Get status of component imports"""
+    return dict(_STATUS)
+
+
+# Convenience function to check if all components are available
+def all_components_available():
+    """Check if all component types are available"""
+    status = get_component_status()
+    return all(status.values())
+
+
+def print_component_status():
+    """Print status of component imports"""
+    print("MagnetGeo Components Status:")
+    status = get_component_status()
+    for component_type, available in status.items():
+        symbol = "✓" if available else "✗"
+        print(f"  {symbol} {component_type}: {available}")
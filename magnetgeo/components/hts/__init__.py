@@ -16,12 +16,9 @@ or electromagnetic analysis. They serve as support structures for the Supra
 magnet component.
 """
 
-from .tape import Tape
-from .pancake import Pancake
-from .isolation import Isolation
-from .dblpancake import DblPancake
-from .structure import HTSinsert
-from .factory import create_uniform_structure, create_from_config
+import importlib
+
+from ...utils.registry import LazyRegistry
 
 __all__ = [
     'Tape',
@@ -37,16 +34,39 @@ __all__ = [
 __version__ = "1.0.0"
 __author__ = "MagnetGeo Development Team"
 
-# Component registry for dynamic loading
-HTS_COMPONENTS = {
-    "Tape": Tape,
-    "Pancake": Pancake,
-    "Isolation": Isolation,
-    "DblPancake": DblPancake,
-    "HTSinsert": HTSinsert,
+# Component registry for dynamic loading; classes are imported on first
+# lookup
+HTS_COMPONENTS = LazyRegistry({
+    "Tape": (f"{__name__}.tape", "Tape"),
+    "Pancake": (f"{__name__}.pancake", "Pancake"),
+    "Isolation": (f"{__name__}.isolation", "Isolation"),
+    "DblPancake": (f"{__name__}.dblpancake", "DblPancake"),
+    "HTSinsert": (f"{__name__}.structure", "HTSinsert"),
+})
+
+# Factory functions -> submodule providing them
+_FACTORIES = {
+    "create_uniform_structure": ".factory",
+    "create_from_config": ".factory",
 }
 
 
+def __getattr__(name: str):
+    """Import HTS components and factory functions on first access"""
+    if name in HTS_COMPONENTS:
+        obj = HTS_COMPONENTS[name]
+    elif name in _FACTORIES:
+        obj = getattr(importlib.import_module(_FACTORIES[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(HTS_COMPONENTS) | set(_FACTORIES))
+
+
 def get_hts_component(class_name: str):
     """
     Get HTS component class by name
@@ -83,19 +103,21 @@ def create_hts_component(class_name: str, data: dict, debug: bool = False):
         Created component object or None if class not found
     """
     cls = get_hts_component(class_name)
-    if cls and hasattr(cls, 'from_dict'):
-        return cls.from_dict(data, debug=debug)
-    elif cls:
+    if cls is None:
+        if debug:
+            print(f"HTS component {class_name} not found")
+        return None
+    
+    try:
+        from_dict = cls.from_dict
+    except AttributeError:
         try:
             return cls(**data)
         except Exception as e:
             if debug:
                 print(f"Failed to create {class_name}: {e}")
             return None
-    
-    if debug:
-        print(f"HTS component {class_name} not found")
-    return None
+    return from_dict(data, debug=debug)
 
 
 def get_package_info():
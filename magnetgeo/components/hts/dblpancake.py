@@ -8,7 +8,8 @@ Defines the geometric structure of double pancake assemblies consisting of
 two pancakes with isolation between them.
 """
 
-from typing import Dict, Any, List, Union
+from math import pi as _PI
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Union
 from .pancake import Pancake
 from .isolation import Isolation
 
@@ -20,14 +21,44 @@ except ImportError:
     SupportComponentBase = object
 
 
+class AssemblyPosition(NamedTuple):
+    """Axial extent and radial bounds of a double pancake assembly"""
+    z_center: float
+    z_bottom: float
+    z_top: float
+    r_inner: float
+    r_outer: float
+
+
+class ComponentPosition(NamedTuple):
+    """Axial extent of a single component"""
+    z_center: float
+    z_bottom: float
+    z_top: float
+
+
+class ComponentPositions(NamedTuple):
+    """Positions returned by DblPancake.get_component_positions()"""
+    assembly: AssemblyPosition
+    bottom_pancake: ComponentPosition
+    top_pancake: ComponentPosition
+    isolation: Optional[ComponentPosition] = None
+
+
 def flatten(nested_list: List) -> List:
     """Flatten nested list structure"""
     result = []
-    for item in nested_list:
-        if isinstance(item, list):
-            result.extend(flatten(item))
+    append = result.append
+    # Explicit stack of iterators instead of one recursive call per level
+    stack = [iter(nested_list)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, list):
+                stack.append(iter(item))
+                break
+            append(item)
         else:
-            result.append(item)
+            stack.pop()
     return result
 
 
@@ -44,6 +75,8 @@ class DblPancake(SupportComponentBase if BASE_AVAILABLE else object):
         isolation: Isolation geometry between pancakes
     """
     
+    __slots__ = ("name", "z0", "pancake", "isolation")
+    
     yaml_tag = "!DblPancake"
     
     def __init__(
@@ -67,13 +100,51 @@ class DblPancake(SupportComponentBase if BASE_AVAILABLE else object):
         self.pancake = pancake if pancake is not None else Pancake()
         self.isolation = isolation if isolation is not None else Isolation()
         
-        self.validate()
+        # pancake and isolation validated themselves when constructed
+        if BASE_AVAILABLE:
+            self._validate_after_init(deep=False)
+        else:
+            self.validate(deep=False)
     
-    def validate(self) -> None:
-        """Validate double pancake geometric parameters"""
+    def _dimensions(self) -> Dict[str, float]:
+        """
+        Get dimensions derived from the pancake and isolation
+        
+        Not cached: the pancake and isolation are usually shared between
+        double pancakes and may be changed in place.
+        
+        Returns:
+            Dictionary with r0, r1, w, h, half_h, pancake_h, isolation_h
+            and has_isolation (isolation present and not empty)
+        """
+        pancake = self.pancake
+        isolation = self.isolation
+        pancake_h = pancake.getH() if pancake else 0.0
+        isolation_h = isolation.getH() if isolation else 0.0
+        h = 2.0 * pancake_h + isolation_h
+        return {
+            "r0": pancake.getR0() if pancake else 0.0,
+            "r1": pancake.getR1() if pancake else 0.0,
+            "w": pancake.getW() if pancake else 0.0,
+            "h": h,
+            "half_h": h / 2.0,
+            "pancake_h": pancake_h,
+            "isolation_h": isolation_h,
+            "has_isolation": bool(isolation) and not isolation.is_empty(),
+        }
+    
+    def validate(self, deep: bool = True) -> None:
+        """
+        Validate double pancake geometric parameters
+        
+        Args:
+            deep: Also validate the pancake and isolation
+        """
         if BASE_AVAILABLE:
             super().validate()
         
+        if not deep:
+            return
         if self.pancake:
             self.pancake.validate()
         if self.isolation:
@@ -94,14 +165,10 @@ class DblPancake(SupportComponentBase if BASE_AVAILABLE else object):
     def setPancake(self, pancake: Pancake) -> None:
         """Set pancake geometry"""
         self.pancake = pancake
-        if self.pancake:
-            self.pancake.validate()
     
     def setIsolation(self, isolation: Isolation) -> None:
         """Set isolation geometry"""
         self.isolation = isolation
-        if self.isolation:
-            self.isolation.validate()
     
     def getR0(self) -> float:
         """Get inner radius of double pancake"""
@@ -129,13 +196,16 @@ class DblPancake(SupportComponentBase if BASE_AVAILABLE else object):
     
     def getH(self) -> float:
         """Get total height of double pancake assembly"""
-        pancake_height = 2.0 * self.pancake.getH() if self.pancake else 0.0
-        isolation_height = self.isolation.getH() if self.isolation else 0.0
-        return pancake_height + isolation_height
+        pancake = self.pancake
+        isolation = self.isolation
+        pancake_h = pancake.getH() if pancake else 0.0
+        isolation_h = isolation.getH() if isolation else 0.0
+        return 2.0 * pancake_h + isolation_h
     
     def getArea(self) -> float:
         """Get cross-sectional area of double pancake in r-z plane"""
-        return self.getW() * self.getH()
+        dims = self._dimensions()
+        return dims["w"] * dims["h"]
     
     def getVolume_cylindrical(self) -> float:
         """
@@ -144,16 +214,15 @@ class DblPancake(SupportComponentBase if BASE_AVAILABLE else object):
         Returns:
             Volume assuming cylindrical geometry
         """
-        import math
-        
         if not self.pancake:
             return 0.0
         
-        r_outer = self.getR1()
-        r_inner = self.getR0()
-        height = self.getH()
+        dims = self._dimensions()
+        r_outer = dims["r1"]
+        r_inner = dims["r0"]
+        height = dims["h"]
         
-        return math.pi * (r_outer**2 - r_inner**2) * height
+        return _PI * (r_outer * r_outer - r_inner * r_inner) * height
     
     def getFillingFactor(self) -> float:
         """
@@ -180,14 +249,14 @@ class DblPancake(SupportComponentBase if BASE_AVAILABLE else object):
         if not self.pancake:
             return (self.z0, self.z0)
         
-        pancake_height = self.pancake.getH()
-        isolation_height = self.isolation.getH() if self.isolation else 0.0
+        dims = self._dimensions()
+        offset = dims["isolation_h"] / 2.0 + dims["pancake_h"] / 2.0
         
         # Bottom pancake center
-        z_bottom = self.z0 - (isolation_height / 2.0 + pancake_height / 2.0)
+        z_bottom = self.z0 - offset
         
         # Top pancake center  
-        z_top = self.z0 + (isolation_height / 2.0 + pancake_height / 2.0)
+        z_top = self.z0 + offset
         
         return (z_bottom, z_top)
     
@@ -205,86 +274,157 @@ class DblPancake(SupportComponentBase if BASE_AVAILABLE else object):
         """
         if detail == "dblpancake":
             return name
+        return list(self._iter_names(name, detail, verbose))
+    
+    def _iter_names(self, name: str, detail: str, verbose: bool = False) -> Iterator[str]:
+        """
+        Yield component names below "dblpancake" detail
         
-        names = []
-        
-        # Bottom pancake
-        if self.pancake:
-            p0_names = self.pancake.get_names(f"{name}_p0", detail, verbose)
-            if isinstance(p0_names, str):
-                names.append(p0_names)
-            else:
-                names.extend(p0_names)
-        
-        # Isolation between pancakes
-        if self.isolation and not self.isolation.is_empty():
-            iso_names = self.isolation.get_names(f"{name}_isolation", detail, verbose)
-            names.extend(iso_names)
-        
-        # Top pancake
-        if self.pancake:
-            p1_names = self.pancake.get_names(f"{name}_p1", detail, verbose)
-            if isinstance(p1_names, str):
-                names.append(p1_names)
+        Args:
+            name: Base name for components
+            detail: Detail level ("pancake", "turn", or "tape")
+            verbose: Whether to print verbose info
+            
+        Yields:
+            Component names, bottom pancake first
+        """
+        pancake = self.pancake
+        
+        # Bottom pancake, isolation between pancakes, top pancake
+        parts = []
+        if pancake:
+            parts.append(pancake.get_names(f"{name}_p0", detail, verbose))
+        isolation = self.isolation
+        if isolation and not isolation.is_empty():
+            parts.append(isolation.get_names(f"{name}_isolation", detail, verbose))
+        if pancake:
+            parts.append(pancake.get_names(f"{name}_p1", detail, verbose))
+        
+        # Pancakes return a bare name at "pancake" detail, lists otherwise
+        count = 0
+        for part in parts:
+            if isinstance(part, str):
+                count += 1
+                yield part
             else:
-                names.extend(p1_names)
+                count += len(part)
+                yield from part
         
         if verbose:
-            print(f"DblPancake '{name}' components ({detail}): {len(names)} items")
-        
-        return names
+            print(f"DblPancake '{name}' components ({detail}): {count} items")
     
     def get_bounds(self) -> tuple:
         """
         Get geometric bounds as (r_bounds, z_bounds)
         
         Returns:
-            Tuple of ([r_min, r_max], [z_min, z_max])
+            Tuple of ((r_min, r_max), (z_min, z_max))
         """
-        r_min = self.getR0()
-        r_max = self.getR1()
-        z_min = self.getZ1()
-        z_max = self.getZ2()
+        dims = self._dimensions()
+        half_height = dims["half_h"]
         
-        return ([r_min, r_max], [z_min, z_max])
+        return ((dims["r0"], dims["r1"]), (self.z0 - half_height, self.z0 + half_height))
     
-    def get_component_positions(self) -> Dict[str, Dict[str, float]]:
+    def get_component_positions(self) -> ComponentPositions:
         """
         Get detailed positions of all components
         
         Returns:
-            Dictionary with component position information
+            ComponentPositions with assembly, pancake and isolation positions
+            (isolation is None when the isolation is empty). Use _asdict()
+            on the result and its fields for a dictionary view.
         """
         z_bottom, z_top = self.get_pancake_positions()
+        dims = self._dimensions()
+        z0 = self.z0
+        half_h = dims["half_h"]
+        half_ph = dims["pancake_h"] / 2 if self.pancake else 0.0
+        
+        isolation = None
+        if dims["has_isolation"]:
+            half_ih = dims["isolation_h"] / 2
+            isolation = ComponentPosition(z0, z0 - half_ih, z0 + half_ih)
+        
+        return ComponentPositions(
+            AssemblyPosition(z0, z0 - half_h, z0 + half_h, dims["r0"], dims["r1"]),
+            ComponentPosition(z_bottom, z_bottom - half_ph, z_bottom + half_ph),
+            ComponentPosition(z_top, z_top - half_ph, z_top + half_ph),
+            isolation,
+        )
+    
+    @staticmethod
+    def compute_positions_bulk(dblpancakes: List['DblPancake']) -> Dict[str, Dict[str, Any]]:
+        """
+        Get component positions for many double pancakes at once
         
-        positions = {
+        Same fields as get_component_positions(), as nested dictionaries
+        with one array entry per double pancake (NumPy arrays when
+        available, lists otherwise). The isolation entry is always present;
+        empty isolations have zero height.
+        
+        Args:
+            dblpancakes: Double pancakes to evaluate
+            
+        Returns:
+            Dictionary with component position arrays
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            # Scalar fallback: collect the per-object results
+            bulk = {}
+            for dp in dblpancakes:
+                positions = dp.get_component_positions()
+                if positions.isolation is None:
+                    positions = positions._replace(
+                        isolation=ComponentPosition(dp.z0, dp.z0, dp.z0)
+                    )
+                for part, values in zip(positions._fields, positions):
+                    target = bulk.setdefault(part, {})
+                    for key, value in zip(values._fields, values):
+                        target.setdefault(key, []).append(value)
+            return bulk
+        
+        count = len(dblpancakes)
+        dims = [dp._dimensions() for dp in dblpancakes]
+        
+        def column(values):
+            return np.fromiter(values, dtype=np.float64, count=count)
+        
+        z0 = column(dp.z0 for dp in dblpancakes)
+        half_h = column(d["h"] for d in dims) / 2.0
+        half_ph = column(d["pancake_h"] for d in dims) / 2.0
+        half_ih = column(
+            d["isolation_h"] if d["has_isolation"] else 0.0 for d in dims
+        ) / 2.0
+        offset = column(d["isolation_h"] for d in dims) / 2.0 + half_ph
+        z_bottom = z0 - offset
+        z_top = z0 + offset
+        
+        return {
             "assembly": {
-                "z_center": self.z0,
-                "z_bottom": self.getZ1(),
-                "z_top": self.getZ2(),
-                "r_inner": self.getR0(),
-                "r_outer": self.getR1()
+                "z_center": z0,
+                "z_bottom": z0 - half_h,
+                "z_top": z0 + half_h,
+                "r_inner": column(d["r0"] for d in dims),
+                "r_outer": column(d["r1"] for d in dims),
             },
             "bottom_pancake": {
                 "z_center": z_bottom,
-                "z_bottom": z_bottom - self.pancake.getH()/2 if self.pancake else z_bottom,
-                "z_top": z_bottom + self.pancake.getH()/2 if self.pancake else z_bottom
+                "z_bottom": z_bottom - half_ph,
+                "z_top": z_bottom + half_ph,
             },
             "top_pancake": {
                 "z_center": z_top,
-                "z_bottom": z_top - self.pancake.getH()/2 if self.pancake else z_top,
-                "z_top": z_top + self.pancake.getH()/2 if self.pancake else z_top
-            }
+                "z_bottom": z_top - half_ph,
+                "z_top": z_top + half_ph,
+            },
+            "isolation": {
+                "z_center": z0,
+                "z_bottom": z0 - half_ih,
+                "z_top": z0 + half_ih,
+            },
         }
-        
-        if self.isolation and not self.isolation.is_empty():
-            positions["isolation"] = {
-                "z_center": self.z0,
-                "z_bottom": self.z0 - self.isolation.getH()/2,
-                "z_top": self.z0 + self.isolation.getH()/2
-            }
-        
-        return positions
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any], debug: bool = False) -> 'DblPancake':
@@ -335,25 +475,35 @@ class DblPancake(SupportComponentBase if BASE_AVAILABLE else object):
     
     def __str__(self) -> str:
         """Detailed string representation"""
-        msg = f"HTS Double Pancake Geometry:\n"
-        msg += f"  Center position: {self.z0:.3f} mm\n"
-        msg += f"  Total height: {self.getH():.3f} mm\n"
-        msg += f"  Inner radius: {self.getR0():.3f} mm\n"
-        msg += f"  Outer radius: {self.getR1():.3f} mm\n"
-        msg += f"  Radial width: {self.getW():.3f} mm\n"
-        
+        parts = [
+            "HTS Double Pancake Geometry:",
+            f"  Center position: {self.z0:.3f} mm",
+            f"  Total height: {self.getH():.3f} mm",
+            f"  Inner radius: {self.getR0():.3f} mm",
+            f"  Outer radius: {self.getR1():.3f} mm",
+            f"  Radial width: {self.getW():.3f} mm",
+        ]
+
         if self.pancake:
-            msg += f"  Pancake turns: {self.pancake.getN()}\n"
             z_bottom, z_top = self.get_pancake_positions()
-            msg += f"  Bottom pancake at: {z_bottom:.3f} mm\n"
-            msg += f"  Top pancake at: {z_top:.3f} mm\n"
-        
-        if self.isolation and not self.isolation.is_empty():
-            msg += f"  Isolation height: {self.isolation.getH():.3f} mm\n"
-            msg += f"  Isolation layers: {self.isolation.getLayer()}\n"
-        
-        msg += f"  Filling factor: {self.getFillingFactor():.1%}"
-        return msg
+            parts.extend(
+                [
+                    f"  Pancake turns: {self.pancake.getN()}",
+                    f"  Bottom pancake at: {z_bottom:.3f} mm",
+                    f"  Top pancake at: {z_top:.3f} mm",
+                ]
+            )
+
+        if self._dimensions()["has_isolation"]:
+            parts.extend(
+                [
+                    f"  Isolation height: {self.isolation.getH():.3f} mm",
+                    f"  Isolation layers: {self.isolation.getLayer()}",
+                ]
+            )
+
+        parts.append(f"  Filling factor: {self.getFillingFactor():.1%}")
+        return "\n".join(parts)
 
 
 def create_symmetric_dblpancake(z0: float, pancake: Pancake, 
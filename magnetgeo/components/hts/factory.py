@@ -8,9 +8,11 @@ Provides convenience functions for creating common HTS geometric configurations
 without requiring detailed knowledge of individual component parameters.
 """
 
+from typing import List, Tuple
+
 from .tape import Tape, create_rebco_tape, create_bismuth_tape
 from .pancake import Pancake, create_uniform_pancake
-from .isolation import create_uniform_isolation, create_kapton_isolation
+from .isolation import Isolation, create_uniform_isolation, create_kapton_isolation
 from .dblpancake import DblPancake
 from .structure import HTSinsert
 
@@ -35,6 +37,37 @@ except ImportError:
         pass
 
 
+def _stack_dblpancakes(
+    n_dblpancakes: int,
+    z_start: float,
+    z_step: float,
+    pancake: Pancake,
+    dp_isolation: Isolation,
+    isolation: Isolation = None,
+) -> Tuple[List[DblPancake], List[Isolation]]:
+    """
+    Stack identical double pancakes at a regular axial pitch
+
+    Args:
+        n_dblpancakes: Number of double pancakes
+        z_start: Bottom of the stack (mm)
+        z_step: Axial pitch between double pancake centers (mm)
+        pancake: Pancake shared by every double pancake
+        dp_isolation: Isolation inside every double pancake
+        isolation: Isolation between double pancakes, or None for none
+
+    Returns:
+        Tuple of (double pancakes, isolations between them)
+    """
+    dblpancakes = [
+        DblPancake(z_start + (i + 0.5) * z_step, pancake, dp_isolation)
+        for i in range(n_dblpancakes)
+    ]
+    # No isolation after the last double pancake
+    isolations = [isolation] * (n_dblpancakes - 1) if isolation is not None else []
+    return dblpancakes, isolations
+
+
 def create_uniform_structure(
     name: str,
     r0: float,
@@ -86,29 +119,24 @@ def create_uniform_structure(
     )
     pancake.tape = tape  # Use specified tape
 
-    # Create double pancakes
-    dblpancakes = []
-    isolations = []
-
     # Calculate spacing
     dp_height = height / n_dblpancakes
     z_start = -height / 2
 
-    for i in range(n_dblpancakes):
-        z_center = z_start + (i + 0.5) * dp_height
-
-        # Create isolation for pancakes within double pancake
-        dp_isolation = create_kapton_isolation(
-            r0=r0, thickness=r1 - r0, height=0.1  # Thin Kapton between pancakes
-        )
+    # Isolation is identical for every double pancake: build it once and
+    # share it, as is already done for the pancake
+    dp_isolation = create_kapton_isolation(
+        r0=r0, thickness=r1 - r0, height=0.1  # Thin Kapton between pancakes
+    )
 
-        dp = DblPancake(z_center, pancake, dp_isolation)
-        dblpancakes.append(dp)
+    # Isolation between double pancakes
+    isolation = None
+    if n_dblpancakes > 1:
+        isolation = create_uniform_isolation(r0, r1 - r0, isolation_height)
 
-        # Create isolation between double pancakes (except after last)
-        if i < n_dblpancakes - 1:
-            isolation = create_uniform_isolation(r0, r1 - r0, isolation_height)
-            isolations.append(isolation)
+    dblpancakes, isolations = _stack_dblpancakes(
+        n_dblpancakes, z_start, dp_height, pancake, dp_isolation, isolation
+    )
 
     return HTSinsert(
         name=name,
@@ -184,31 +212,25 @@ def create_solenoid_structure(
     r1 = pancake.getR1()
     radial_width = r1 - r0
 
-    # Create double pancakes with spacing
-    dblpancakes = []
-    isolations = []
-
     dp_height = tape_height * 2 + 0.2  # Two pancakes + thin isolation
     total_height = n_dblpancakes * dp_height * spacing_factor
 
     z_start = -total_height / 2
     z_step = total_height / n_dblpancakes
 
-    for i in range(n_dblpancakes):
-        z_center = z_start + (i + 0.5) * z_step
-
-        # Isolation within double pancake
-        dp_isolation = create_kapton_isolation(r0, radial_width, 0.1, 1)
+    # Isolation within double pancake, shared like the pancake
+    dp_isolation = create_kapton_isolation(r0, radial_width, 0.1, 1)
 
-        dp = DblPancake(z_center, pancake, dp_isolation)
-        dblpancakes.append(dp)
+    # Isolation between double pancakes, if there is room for one
+    isolation = None
+    iso_height = z_step - dp_height
+    if iso_height > 0:
+        isolation = create_uniform_isolation(r0, radial_width, iso_height)
 
-        # Isolation between double pancakes
-        if i < n_dblpancakes - 1:
-            iso_height = z_step - dp_height
-            if iso_height > 0:
-                isolation = create_uniform_isolation(r0, radial_width, iso_height)
-                isolations.append(isolation)
+    # Create double pancakes with spacing
+    dblpancakes, isolations = _stack_dblpancakes(
+        n_dblpancakes, z_start, z_step, pancake, dp_isolation, isolation
+    )
 
     return HTSinsert(
         name=name,
@@ -8,10 +8,14 @@ Defines the geometric structure of isolation layers between HTS components
 including multi-layer insulation configurations.
 """
 
+from contextlib import nullcontext
+from itertools import accumulate
+from math import pi as _PI
 from typing import Dict, Any, List
 import warnings
 
 try:
+    from ...base.serializable import validation_disabled
     from ...base.support_base import SupportComponentBase
     from ...utils.validation import validate_non_negative
 
@@ -19,11 +23,17 @@ try:
 except ImportError:
     BASE_AVAILABLE = False
     SupportComponentBase = object
+    validation_disabled = nullcontext
 
     def validate_non_negative(val, name):
         pass
 
 
+def _all_non_negative(values: List[float]) -> bool:
+    """Check that all values are non-negative numbers"""
+    return all(isinstance(v, (int, float)) and v >= 0 for v in values)
+
+
 class Isolation(SupportComponentBase if BASE_AVAILABLE else object):
     """
     HTS isolation layer geometric definition
@@ -37,6 +47,8 @@ class Isolation(SupportComponentBase if BASE_AVAILABLE else object):
         h: Heights of different isolation layers (mm)
     """
 
+    __slots__ = ("name", "r0", "w", "h")
+
     yaml_tag = "!Isolation"
 
     def __init__(self, r0: float = 0, w: List[float] = None, h: List[float] = None):
@@ -55,7 +67,10 @@ class Isolation(SupportComponentBase if BASE_AVAILABLE else object):
         self.w = w if w is not None else []
         self.h = h if h is not None else []
 
-        self.validate()
+        if BASE_AVAILABLE:
+            self._validate_after_init()
+        else:
+            self.validate()
 
     def validate(self) -> None:
         """Validate isolation geometric parameters"""
@@ -64,11 +79,14 @@ class Isolation(SupportComponentBase if BASE_AVAILABLE else object):
 
         validate_non_negative(self.r0, "r0 (inner radius)")
 
-        for i, width in enumerate(self.w):
-            validate_non_negative(width, f"w[{i}] (layer width)")
+        # Per-layer checks (and their messages) only when a layer fails
+        if not _all_non_negative(self.w):
+            for i, width in enumerate(self.w):
+                validate_non_negative(width, f"w[{i}] (layer width)")
 
-        for i, height in enumerate(self.h):
-            validate_non_negative(height, f"h[{i}] (layer height)")
+        if not _all_non_negative(self.h):
+            for i, height in enumerate(self.h):
+                validate_non_negative(height, f"h[{i}] (layer height)")
 
         # Warn if layer counts don't match
         if len(self.w) != len(self.h) and self.w and self.h:
@@ -136,8 +154,6 @@ class Isolation(SupportComponentBase if BASE_AVAILABLE else object):
         Returns:
             Volume assuming cylindrical geometry
         """
-        import math
-
         if not self.w or not self.h:
             return 0.0
 
@@ -145,7 +161,7 @@ class Isolation(SupportComponentBase if BASE_AVAILABLE else object):
         r_inner = self.r0
         height = self.getH()
 
-        return math.pi * (r_outer**2 - r_inner**2) * height
+        return _PI * (r_outer * r_outer - r_inner * r_inner) * height
 
     def get_layer_radii(self) -> List[tuple]:
         """
@@ -157,15 +173,9 @@ class Isolation(SupportComponentBase if BASE_AVAILABLE else object):
         if not self.w:
             return []
 
-        layers = []
-        r_current = self.r0
-
-        for width in self.w:
-            r_next = r_current + width
-            layers.append((r_current, r_next))
-            r_current = r_next
-
-        return layers
+        # Layer boundaries as a running sum starting from r0
+        edges = list(accumulate(self.w, initial=self.r0))
+        return list(zip(edges, edges[1:]))
 
     def get_names(self, name: str, detail: str, verbose: bool = False) -> List[str]:
         """
@@ -181,9 +191,7 @@ class Isolation(SupportComponentBase if BASE_AVAILABLE else object):
         """
         if detail == "layer" and len(self.w) > 1:
             # Individual layers
-            names = []
-            for i in range(len(self.w)):
-                names.append(f"{name}_Layer{i}")
+            names = [f"{name}_Layer{i}" for i in range(len(self.w))]
         else:
             # Single isolation name
             names = [name]
@@ -198,16 +206,11 @@ class Isolation(SupportComponentBase if BASE_AVAILABLE else object):
         Get geometric bounds as (r_bounds, z_bounds)
 
         Returns:
-            Tuple of ([r_min, r_max], [z_min, z_max])
+            Tuple of ((r_min, r_max), (z_min, z_max))
         """
-        r_min = self.r0
-        r_max = self.getR1()
-
         half_height = self.getH() / 2.0
-        z_min = -half_height
-        z_max = half_height
 
-        return ([r_min, r_max], [z_min, z_max])
+        return ((self.r0, self.getR1()), (-half_height, half_height))
 
     def is_empty(self) -> bool:
         """Check if isolation is effectively empty"""
@@ -286,7 +289,9 @@ def create_uniform_isolation(r0: float, width: float, height: float) -> Isolatio
     validate_non_negative(width, "width")
     validate_non_negative(height, "height")
 
-    return Isolation(r0, [width], [height])
+    # Arguments checked above; skip repeating them in the constructor
+    with validation_disabled():
+        return Isolation(r0, [width], [height])
 
 
 def create_multilayer_isolation(r0: float, layer_specs: List[tuple]) -> Isolation:
@@ -319,7 +324,8 @@ def create_multilayer_isolation(r0: float, layer_specs: List[tuple]) -> Isolatio
         widths.append(width)
         heights.append(height)
 
-    return Isolation(r0, widths, heights)
+    with validation_disabled():
+        return Isolation(r0, widths, heights)
 
 
 def create_vacuum_isolation(r0: float, gap: float, height: float) -> Isolation:
@@ -358,7 +364,11 @@ def create_kapton_isolation(
         raise ValueError("Number of layers must be positive")
 
     if n_layers == 1:
-        return create_uniform_isolation(r0, thickness, height)
+        # Same as create_uniform_isolation(), without re-checking thickness
+        validate_non_negative(r0, "r0")
+        validate_non_negative(height, "height")
+        with validation_disabled():
+            return Isolation(r0, [thickness], [height])
     else:
         # Multiple identical layers
         layer_specs = [(thickness, height)] * n_layers
@@ -396,15 +406,18 @@ def create_graded_isolation(
         avg_thickness = (thickness_start + thickness_end) / 2
         return create_uniform_isolation(r0, avg_thickness, height)
 
-    # Create graded layers
-    layer_specs = []
-    for i in range(n_layers):
-        # Linear interpolation
-        factor = i / (n_layers - 1)
-        thickness = thickness_start + factor * (thickness_end - thickness_start)
-        layer_specs.append((thickness, height))
+    # Create graded layers by linear interpolation. Interpolated thicknesses
+    # lie between the validated end values, so only r0 and the shared
+    # height still need checking.
+    validate_non_negative(r0, "r0")
+    validate_non_negative(height, "height")
+
+    last = n_layers - 1
+    delta = thickness_end - thickness_start
+    widths = [thickness_start + (i / last) * delta for i in range(n_layers)]
 
-    return create_multilayer_isolation(r0, layer_specs)
+    with validation_disabled():
+        return Isolation(r0, widths, [height] * n_layers)
 
 
 # Isolation factory registry
@@ -428,11 +441,11 @@ def create_isolation_from_spec(isolation_type: str, **kwargs) -> Isolation:
     Returns:
         Isolation instance
     """
-    if isolation_type not in ISOLATION_FACTORIES:
+    factory = ISOLATION_FACTORIES.get(isolation_type)
+    if factory is None:
         raise ValueError(
             f"Unknown isolation type '{isolation_type}'. "
             f"Available types: {list(ISOLATION_FACTORIES.keys())}"
         )
 
-    factory = ISOLATION_FACTORIES[isolation_type]
     return factory(**kwargs)
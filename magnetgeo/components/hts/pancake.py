@@ -8,7 +8,8 @@ Defines the geometric structure of HTS pancake coils including
 inner radius, turn count, tape geometry, and mandrel dimensions.
 """
 
-from typing import Dict, Any, List, Union
+from math import pi as _PI
+from typing import Dict, Any, List, Tuple, Union
 from .tape import Tape
 
 try:
@@ -21,6 +22,31 @@ except ImportError:
     def validate_non_negative(val, name): pass
     def validate_positive(val, name): pass
 
+# Below this many turns a comprehension beats building a NumPy array
+_NUMPY_MIN_TURNS = 64
+
+
+def _turn_radii(r_start: float, dr: float, n: int) -> List[float]:
+    """
+    Get radii r_start + i * dr for i in range(n)
+
+    Args:
+        r_start: Radius of the first turn
+        dr: Radial pitch between turns
+        n: Number of turns
+
+    Returns:
+        List of n radii
+    """
+    if n >= _NUMPY_MIN_TURNS:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            return (np.arange(n, dtype=np.float64) * dr + r_start).tolist()
+    return [r_start + i * dr for i in range(n)]
+
 
 class Pancake(SupportComponentBase if BASE_AVAILABLE else object):
     """
@@ -34,8 +60,14 @@ class Pancake(SupportComponentBase if BASE_AVAILABLE else object):
         mandrin: Mandrel inner radius for mesh purposes (mm)
         tape: Tape geometry object
         n: Number of tape turns
+
+    Dimensions derived from r0, n and the tape are cached, and recomputed
+    whenever one of them (or a tape dimension) has changed.
     """
     
+    # Private _cache slot is left out of serialized state
+    __slots__ = ("name", "r0", "mandrin", "tape", "n", "_cache")
+
     yaml_tag = "!Pancake"
     
     def __init__(
@@ -62,23 +94,80 @@ class Pancake(SupportComponentBase if BASE_AVAILABLE else object):
         self.tape = tape if tape is not None else Tape()
         self.n = int(n)
         
-        self.validate()
+        # tape validated itself when constructed
+        if BASE_AVAILABLE:
+            self._validate_after_init(deep=False)
+        else:
+            self.validate(deep=False)
     
-    def validate(self) -> None:
-        """Validate pancake geometric parameters"""
+    def _dimensions(self) -> Dict[str, float]:
+        """
+        Get dimensions derived from r0, tape and n
+        
+        The cache is keyed on r0, n and the tape dimensions, so changes to
+        a (possibly shared) tape are picked up as well. The turn radii are
+        added under "radii" and "centers" once first requested.
+        
+        Returns:
+            Dictionary with r1, w, h, area and filling_factor
+        """
+        tape = self.tape
+        if tape:
+            key = (self.r0, self.n, tape.w, tape.h, tape.e)
+        else:
+            key = (self.r0, self.n, None)
+        try:
+            cache = self._cache
+            if cache["key"] == key:
+                return cache
+        except AttributeError:
+            pass
+        
+        # n == 0 gives r1 == r0 without a separate branch
+        r1 = self.r0 + self.n * tape.getW() if tape else self.r0
+        w = r1 - self.r0
+        h = tape.getH() if tape else 0.0
+        area = w * h
+        if area == 0 or not tape:
+            filling_factor = 0.0
+        else:
+            filling_factor = self.n * tape.getArea() / area
+        self._cache = cache = {
+            "key": key,
+            "r1": r1,
+            "w": w,
+            "h": h,
+            "area": area,
+            "filling_factor": filling_factor,
+        }
+        return cache
+    
+    def validate(self, deep: bool = True) -> None:
+        """
+        Validate pancake geometric parameters
+        
+        Args:
+            deep: Also validate the tape
+        """
         if BASE_AVAILABLE:
             super().validate()
         
-        validate_non_negative(self.r0, "r0 (inner radius)")
-        validate_non_negative(self.mandrin, "mandrin (mandrel radius)")
+        r0 = self.r0
+        mandrin = self.mandrin
+        
+        # Inline fast path; the helpers only run to report a failure
+        if not (isinstance(r0, (int, float)) and r0 >= 0):
+            validate_non_negative(r0, "r0 (inner radius)")
+        if not (isinstance(mandrin, (int, float)) and mandrin >= 0):
+            validate_non_negative(mandrin, "mandrin (mandrel radius)")
         
         if self.n < 0:
             raise ValueError("Number of turns must be non-negative")
         
-        if self.mandrin > self.r0:
-            raise ValueError(f"Mandrel radius ({self.mandrin}) must be <= inner radius ({self.r0})")
+        if mandrin > r0:
+            raise ValueError(f"Mandrel radius ({mandrin}) must be <= inner radius ({r0})")
         
-        if self.tape:
+        if deep and self.tape:
             self.tape.validate()
     
     def getN(self) -> int:
@@ -99,61 +188,54 @@ class Pancake(SupportComponentBase if BASE_AVAILABLE else object):
     
     def getR1(self) -> float:
         """Get pancake outer radius"""
-        if self.tape and self.n > 0:
-            return self.r0 + self.n * self.tape.getW()
-        return self.r0
+        return self._dimensions()["r1"]
     
     def getW(self) -> float:
         """Get pancake radial width"""
-        return self.getR1() - self.getR0()
+        return self._dimensions()["w"]
     
     def getH(self) -> float:
         """Get pancake height (same as tape height)"""
-        return self.tape.getH() if self.tape else 0.0
+        return self._dimensions()["h"]
     
     def getArea(self) -> float:
         """Get pancake cross-sectional area in r-z plane"""
-        return self.getW() * self.getH()
+        return self._dimensions()["area"]
     
-    def getR(self) -> List[float]:
+    def getR(self) -> Tuple[float, ...]:
         """
-        Get list of tape turn inner radii
+        Get tape turn inner radii
         
         Returns:
-            List of radii for each tape turn
+            Tuple of radii for each tape turn (cached, shared between calls)
         """
         if not self.tape or self.n == 0:
-            return []
-        
-        radii = []
-        ri = self.getR0()
-        dr = self.tape.getW()
+            return ()
         
-        for i in range(self.n):
-            radii.append(ri)
-            ri += dr
-        
-        return radii
+        dims = self._dimensions()
+        try:
+            return dims["radii"]
+        except KeyError:
+            radii = dims["radii"] = tuple(_turn_radii(self.r0, self.tape.getW(), self.n))
+            return radii
     
-    def get_turn_centers(self) -> List[float]:
+    def get_turn_centers(self) -> Tuple[float, ...]:
         """
         Get radial positions of tape turn centers
         
         Returns:
-            List of center radii for each turn
+            Tuple of center radii for each turn (cached, shared between calls)
         """
         if not self.tape or self.n == 0:
-            return []
-        
-        centers = []
-        ri = self.getR0()
-        dr = self.tape.getW()
+            return ()
         
-        for i in range(self.n):
-            centers.append(ri + dr / 2.0)
-            ri += dr
-        
-        return centers
+        dims = self._dimensions()
+        try:
+            return dims["centers"]
+        except KeyError:
+            dr = self.tape.getW()
+            centers = dims["centers"] = tuple(_turn_radii(self.r0 + dr / 2.0, dr, self.n))
+            return centers
     
     def getFillingFactor(self) -> float:
         """
@@ -162,12 +244,7 @@ class Pancake(SupportComponentBase if BASE_AVAILABLE else object):
         Returns:
             Filling factor as fraction (0.0 to 1.0)
         """
-        total_area = self.getArea()
-        if total_area == 0 or not self.tape:
-            return 0.0
-        
-        tape_area = self.n * self.tape.getArea()
-        return tape_area / total_area
+        return self._dimensions()["filling_factor"]
     
     def get_names(self, name: str, detail: str, verbose: bool = False) -> Union[str, List[str]]:
         """
@@ -192,13 +269,14 @@ class Pancake(SupportComponentBase if BASE_AVAILABLE else object):
         
         if detail == "turn":
             # Individual turns
-            for i in range(self.n):
-                names.append(f"{name}_Turn{i}")
+            names.extend([f"{name}_Turn{i}" for i in range(self.n)])
         elif detail == "tape":
-            # Individual tape components per turn
-            for i in range(self.n):
-                tape_names = self.tape.get_names(f"{name}_Turn{i}", detail)
-                names.extend(tape_names)
+            # Individual tape components per turn: every turn has the same
+            # tape parts, so ask the tape for its name suffixes only once
+            suffixes = self.tape.get_names("", detail)
+            names.extend(
+                [f"{name}_Turn{i}{suffix}" for i in range(self.n) for suffix in suffixes]
+            )
         else:
             # Default: just pancake name
             names.append(name)
@@ -213,16 +291,13 @@ class Pancake(SupportComponentBase if BASE_AVAILABLE else object):
         Get geometric bounds as (r_bounds, z_bounds)
         
         Returns:
-            Tuple of ([r_min, r_max], [z_min, z_max])
+            Tuple of ((r_min, r_max), (z_min, z_max))
         """
+        dims = self._dimensions()
         r_min = self.mandrin if self.mandrin < self.r0 else self.r0
-        r_max = self.getR1()
-        
-        half_height = self.getH() / 2.0
-        z_min = -half_height
-        z_max = half_height
+        half_height = dims["h"] / 2.0
         
-        return ([r_min, r_max], [z_min, z_max])
+        return ((r_min, dims["r1"]), (-half_height, half_height))
     
     def calculate_length(self) -> float:
         """
@@ -231,19 +306,71 @@ class Pancake(SupportComponentBase if BASE_AVAILABLE else object):
         Returns:
             Total tape length (mm)
         """
-        if not self.tape or self.n == 0:
+        if not self.tape:
             return 0.0
         
-        import math
+        # Sum of 2*pi*r over the turn centers r0 + (i + 1/2) * dr (0 for n == 0)
+        n = self.n
+        return 2.0 * _PI * n * (self.r0 + 0.5 * n * self.tape.getW())
+    
+    @staticmethod
+    def compute_dimensions_bulk(pancakes: List['Pancake']) -> Dict[str, Any]:
+        """
+        Get dimensions of many pancakes at once
         
-        total_length = 0.0
-        radii = self.get_turn_centers()
+        One array entry per pancake (NumPy arrays when available, lists
+        otherwise), matching getR0(), getR1(), getW(), getH(), getArea()
+        and calculate_length().
         
-        for radius in radii:
-            circumference = 2 * math.pi * radius
-            total_length += circumference
+        Args:
+            pancakes: Pancakes to evaluate
+            
+        Returns:
+            Dictionary with r0, r1, w, h, area and length arrays
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            # Scalar fallback: collect the per-object results
+            bulk = {"r0": [], "r1": [], "w": [], "h": [], "area": [], "length": []}
+            for pancake in pancakes:
+                dims = pancake._dimensions()
+                bulk["r0"].append(pancake.r0)
+                bulk["r1"].append(dims["r1"])
+                bulk["w"].append(dims["w"])
+                bulk["h"].append(dims["h"])
+                bulk["area"].append(dims["area"])
+                bulk["length"].append(pancake.calculate_length())
+            return bulk
+        
+        # One pass over the pancakes fills an (N, 4) table of
+        # r0, n, tape width and tape height; pancakes without a tape have
+        # no turns, width or height
+        table = np.fromiter(
+            (
+                value
+                for p in pancakes
+                for value in (
+                    (p.r0, p.n, p.tape.getW(), p.tape.getH())
+                    if p.tape
+                    else (p.r0, 0.0, 0.0, 0.0)
+                )
+            ),
+            dtype=np.float64,
+            count=4 * len(pancakes),
+        ).reshape(-1, 4)
+        r0, n, tape_w, h = table.T
+        r1 = r0 + n * tape_w
+        w = r1 - r0
         
-        return total_length
+        return {
+            "r0": r0,
+            "r1": r1,
+            "w": w,
+            "h": h,
+            "area": w * h,
+            "length": 2.0 * _PI * n * (r0 + 0.5 * n * tape_w),
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any], debug: bool = False) -> 'Pancake':
@@ -289,18 +416,25 @@ class Pancake(SupportComponentBase if BASE_AVAILABLE else object):
     
     def __str__(self) -> str:
         """Detailed string representation"""
-        msg = f"HTS Pancake Geometry:\n"
-        msg += f"  Inner radius: {self.r0:.3f} mm\n"
-        msg += f"  Outer radius: {self.getR1():.3f} mm\n"
-        msg += f"  Radial width: {self.getW():.3f} mm\n"
-        msg += f"  Height: {self.getH():.3f} mm\n"
-        msg += f"  Number of turns: {self.n}\n"
-        msg += f"  Mandrel radius: {self.mandrin:.3f} mm\n"
+        dims = self._dimensions()
+        parts = [
+            "HTS Pancake Geometry:",
+            f"  Inner radius: {self.r0:.3f} mm",
+            f"  Outer radius: {dims['r1']:.3f} mm",
+            f"  Radial width: {dims['w']:.3f} mm",
+            f"  Height: {dims['h']:.3f} mm",
+            f"  Number of turns: {self.n}",
+            f"  Mandrel radius: {self.mandrin:.3f} mm",
+        ]
         if self.tape:
-            msg += f"  Tape width: {self.tape.getW():.3f} mm\n"
-            msg += f"  Total length: {self.calculate_length():.1f} mm\n"
-        msg += f"  Filling factor: {self.getFillingFactor():.1%}"
-        return msg
+            parts.extend(
+                [
+                    f"  Tape width: {self.tape.getW():.3f} mm",
+                    f"  Total length: {self.calculate_length():.1f} mm",
+                ]
+            )
+        parts.append(f"  Filling factor: {dims['filling_factor']:.1%}")
+        return "\n".join(parts)
 
 
 def create_uniform_pancake(r0: float, r1: float, height: float, 
@@ -332,6 +466,54 @@ def create_uniform_pancake(r0: float, r1: float, height: float,
     return Pancake(r0=r0, tape=tape, n=n_turns, mandrin=mandrin)
 
 
+def uniform_pancake_parameters(r0, r1, height, tape_width,
+                               mandrin_offset: float = 1.0) -> Dict[str, Any]:
+    """
+    Get the parameters create_uniform_pancake() would use, for many pancakes
+    
+    Meant for parameter sweeps that only need turn counts and dimensions,
+    without building Pancake and Tape objects. Arguments are arrays (or
+    scalars broadcast against them). Requires NumPy.
+    
+    Args:
+        r0: Inner radii
+        r1: Outer radii
+        height: Pancake heights
+        tape_width: Tape total widths
+        mandrin_offset: Mandrel offset from inner radius
+        
+    Returns:
+        Dictionary with r0, n, mandrin, tape_w, tape_h and tape_e arrays,
+        matching the Pancake and Tape arguments of create_uniform_pancake()
+        
+    Raises:
+        ValueError: If any radial width, height or tape width is not positive
+    """
+    import numpy as np
+    
+    r0, r1, height, tape_width = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(a, dtype=np.float64)) for a in (r0, r1, height, tape_width))
+    )
+    radial_width = r1 - r0
+    
+    for values, name in ((radial_width, "radial width"), (height, "height"),
+                         (tape_width, "tape_width")):
+        bad = ~(values > 0)
+        if bad.any():
+            i = int(np.argmax(bad))
+            raise ValueError(f"{name} must be positive, got {values[i]} (entry {i})")
+    
+    return {
+        "r0": r0,
+        # astype truncates like int() for these positive ratios
+        "n": (radial_width / tape_width).astype(np.int64),
+        "mandrin": np.maximum(0.0, r0 - mandrin_offset),
+        "tape_w": tape_width * 0.9,
+        "tape_h": height,
+        "tape_e": tape_width * 0.1,
+    }
+
+
 def create_solenoid_pancake(r0: float, n_turns: int, tape: Tape, 
                            mandrin_offset: float = 1.0) -> Pancake:
     """
@@ -376,11 +558,9 @@ def create_racetrack_pancake(r0: float, straight_length: float,
         additional geometric definitions beyond simple pancake model.
     """
     # For now, approximate as circular with equivalent area
-    import math
-    
     # Approximate equivalent radius
-    curved_circumference = 2 * math.pi * r0
+    curved_circumference = 2 * _PI * r0
     total_length_per_turn = curved_circumference + 2 * straight_length
-    equiv_radius = total_length_per_turn / (2 * math.pi)
+    equiv_radius = total_length_per_turn / (2 * _PI)
     
     return Pancake(r0=r0, tape=tape, n=n_turns, mandrin=r0 * 0.9)
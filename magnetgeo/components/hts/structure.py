@@ -11,7 +11,7 @@ the Supra magnet component.
 
 import json
 import os
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from .tape import Tape
 from .pancake import Pancake
 from .isolation import Isolation
@@ -28,16 +28,51 @@ except ImportError:
     def validate_non_negative(val, name): pass
     def validate_string_not_empty(val, name): pass
 
+# Below this many double pancakes a Python loop beats building a NumPy array
+_NUMPY_MIN_DBLPANCAKES = 64
 
-def flatten(nested_list: List) -> List:
-    """Flatten nested list structure"""
-    result = []
-    for item in nested_list:
-        if isinstance(item, list):
-            result.extend(flatten(item))
+
+def _dp_bottoms(
+    z_start: float, dp_heights: List[float], iso_heights: List[float]
+) -> Tuple[List[float], float]:
+    """
+    Get bottom positions of stacked double pancakes
+    
+    Double pancakes are stacked from z_start upwards, each separated from
+    the next one by an isolation.
+    
+    Args:
+        z_start: Bottom of the stack
+        dp_heights: Height of each double pancake
+        iso_heights: Height of each isolation, one fewer than dp_heights
+        
+    Returns:
+        Tuple of (bottom of each double pancake, top of the stack)
+    """
+    n = len(dp_heights)
+    if n >= _NUMPY_MIN_DBLPANCAKES and len(iso_heights) == n - 1:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
         else:
-            result.append(item)
-    return result
+            # Running sum of z_start, dp0, iso0, dp1, ...; same additions in
+            # the same order as the loop below, so results are identical
+            steps = np.empty(2 * n, dtype=np.float64)
+            steps[0] = z_start
+            steps[1::2] = dp_heights
+            steps[2::2] = iso_heights
+            z = np.add.accumulate(steps)
+            return z[0::2].tolist(), float(z[-1])
+    
+    bottoms = []
+    z = z_start
+    for i, dp_height in enumerate(dp_heights):
+        bottoms.append(z)
+        z += dp_height
+        if i < len(iso_heights):
+            z += iso_heights[i]
+    return bottoms, z
 
 
 class HTSinsert(SupportComponentBase if BASE_AVAILABLE else object):
@@ -60,6 +95,10 @@ class HTSinsert(SupportComponentBase if BASE_AVAILABLE else object):
         isolations: List of isolation geometries between double pancakes
     """
     
+    __slots__ = (
+        "name", "z0", "h", "r0", "r1", "z1", "n", "dblpancakes", "isolations",
+    )
+    
     yaml_tag = "!HTSinsert"
     
     def __init__(
@@ -102,10 +141,56 @@ class HTSinsert(SupportComponentBase if BASE_AVAILABLE else object):
         self.dblpancakes = dblpancakes if dblpancakes is not None else []
         self.isolations = isolations if isolations is not None else []
         
-        self.validate()
+        # double pancakes and isolations validated themselves when constructed
+        if BASE_AVAILABLE:
+            self._validate_after_init(deep=False)
+        else:
+            self.validate(deep=False)
     
-    def validate(self) -> None:
-        """Validate HTS insert geometric parameters"""
+    def _tape_columns(self) -> Dict[str, List[Any]]:
+        """
+        Get tape data for each double pancake
+        
+        Built in a single pass over the double pancakes on every call; the
+        double pancakes and their (shared) pancakes and tapes may change in
+        place, so nothing is kept.
+        
+        Returns:
+            Dictionary of parallel lists: ntapes, htapes, wtapes_sc and
+            wtapes_isolation (0 for missing pancakes or tapes)
+        """
+        ntapes = []
+        htapes = []
+        wtapes_sc = []
+        wtapes_iso = []
+        for dp in self.dblpancakes:
+            pancake = dp.pancake if dp else None
+            tape = pancake.tape if pancake else None
+            # Each double pancake has 2 pancakes
+            ntapes.append(2 * pancake.getN() if pancake else 0)
+            if tape:
+                htapes.append(tape.getH())
+                wtapes_sc.append(tape.getW_Sc())
+                wtapes_iso.append(tape.getW_Isolation())
+            else:
+                htapes.append(0.0)
+                wtapes_sc.append(0.0)
+                wtapes_iso.append(0.0)
+        
+        return {
+            "ntapes": ntapes,
+            "htapes": htapes,
+            "wtapes_sc": wtapes_sc,
+            "wtapes_isolation": wtapes_iso,
+        }
+    
+    def validate(self, deep: bool = True) -> None:
+        """
+        Validate HTS insert geometric parameters
+        
+        Args:
+            deep: Also validate the double pancakes and isolations
+        """
         if BASE_AVAILABLE:
             super().validate()
         
@@ -120,6 +205,9 @@ class HTSinsert(SupportComponentBase if BASE_AVAILABLE else object):
         if self.n < 0:
             raise ValueError("Number of double pancakes must be non-negative")
         
+        if not deep:
+            return
+        
         # Validate components
         for i, dp in enumerate(self.dblpancakes):
             if dp:
@@ -172,56 +260,31 @@ class HTSinsert(SupportComponentBase if BASE_AVAILABLE else object):
         """Get insert cross-sectional area in r-z plane"""
         return self.getW() * self.getH()
     
-    def get_bounds(self) -> Tuple[List[float], List[float]]:
+    def get_bounds(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
         """
         Get geometric bounds
         
         Returns:
-            Tuple of ([r_min, r_max], [z_min, z_max])
+            Tuple of ((r_min, r_max), (z_min, z_max))
         """
-        return ([self.r0, self.r1], [self.z1, self.z1 + self.h])
+        return ((self.r0, self.r1), (self.z1, self.z1 + self.h))
     
     # Component access methods
     def getNtapes(self) -> List[int]:
         """Get number of tapes for each double pancake"""
-        n_tapes = []
-        for dp in self.dblpancakes:
-            if dp and dp.pancake:
-                # Each double pancake has 2 pancakes
-                n_tapes.append(2 * dp.pancake.getN())
-            else:
-                n_tapes.append(0)
-        return n_tapes
+        return self._tape_columns()["ntapes"]
     
     def getHtapes(self) -> List[float]:
         """Get tape heights for each double pancake"""
-        h_tapes = []
-        for dp in self.dblpancakes:
-            if dp and dp.pancake and dp.pancake.tape:
-                h_tapes.append(dp.pancake.tape.getH())
-            else:
-                h_tapes.append(0.0)
-        return h_tapes
+        return self._tape_columns()["htapes"]
     
     def getWtapes_SC(self) -> List[float]:
         """Get superconductor tape widths for each double pancake"""
-        w_tapes = []
-        for dp in self.dblpancakes:
-            if dp and dp.pancake and dp.pancake.tape:
-                w_tapes.append(dp.pancake.tape.getW_Sc())
-            else:
-                w_tapes.append(0.0)
-        return w_tapes
+        return self._tape_columns()["wtapes_sc"]
     
     def getWtapes_Isolation(self) -> List[float]:
         """Get tape isolation widths for each double pancake"""
-        w_iso = []
-        for dp in self.dblpancakes:
-            if dp and dp.pancake and dp.pancake.tape:
-                w_iso.append(dp.pancake.tape.getW_Isolation())
-            else:
-                w_iso.append(0.0)
-        return w_iso
+        return self._tape_columns()["wtapes_isolation"]
     
     def get_dblpancake_positions(self) -> List[float]:
         """Get z-positions of double pancake centers"""
@@ -250,10 +313,28 @@ class HTSinsert(SupportComponentBase if BASE_AVAILABLE else object):
         Returns:
             List of component names
         """
-        names = []
-        prefix = f"{mname}_" if mname else ""
+        names = list(self._iter_names(mname, detail, verbose))
         
-        n_dp = len(self.dblpancakes)
+        if verbose:
+            print(f"HTSinsert '{mname}' total components ({detail}): {len(names)}")
+        
+        return names
+    
+    def _iter_names(self, mname: str, detail: str, verbose: bool = False) -> Iterator[str]:
+        """
+        Yield component names for meshing/CAD, bottom to top
+        
+        Args:
+            mname: Base name for components
+            detail: Detail level ("dblpancake", "pancake", "turn", or "tape")
+            verbose: Whether to print verbose info
+            
+        Yields:
+            Component names
+        """
+        prefix = f"{mname}_" if mname else ""
+        isolations = self.isolations
+        n_iso = min(len(self.dblpancakes) - 1, len(isolations))
         
         # Double pancake components
         for i, dp in enumerate(self.dblpancakes):
@@ -262,25 +343,16 @@ class HTSinsert(SupportComponentBase if BASE_AVAILABLE else object):
                     print(f"HTSinsert.get_names: dblpancake[{i}]")
                 
                 dp_name = f"{prefix}dp{i}"
-                dp_names = dp.get_names(dp_name, detail, verbose)
-                
-                if isinstance(dp_names, str):
-                    names.append(dp_names)
+                if detail == "dblpancake":
+                    yield dp_name
                 else:
-                    names.extend(dp_names)
+                    yield from dp._iter_names(dp_name, detail, verbose)
             
             # Isolation between double pancakes (not after last one)
-            if i < n_dp - 1 and i < len(self.isolations):
-                iso = self.isolations[i]
+            if i < n_iso:
+                iso = isolations[i]
                 if iso and not iso.is_empty():
-                    iso_name = f"{prefix}iso{i}"
-                    iso_names = iso.get_names(iso_name, detail, verbose)
-                    names.extend(iso_names)
-        
-        if verbose:
-            print(f"HTSinsert '{mname}' total components ({detail}): {len(names)}")
-        
-        return names
+                    yield from iso.get_names(f"{prefix}iso{i}", detail, verbose)
     
     def get_lc(self) -> Tuple[float, ...]:
         """
@@ -293,10 +365,12 @@ class HTSinsert(SupportComponentBase if BASE_AVAILABLE else object):
             return (1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0)
         
         # Use first available components for characteristic sizing
-        dp = self.dblpancakes[0] if self.dblpancakes else None
-        iso = self.isolations[0] if self.isolations else None
+        dp = self.dblpancakes[0]
+        iso = self.isolations[0]
+        pancake = dp.pancake if dp else None
+        tape = pancake.tape if pancake else None
         
-        if not dp or not dp.pancake or not dp.pancake.tape:
+        if not tape:
             return (1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0)
         
         # Isolation between double pancakes
@@ -306,20 +380,21 @@ class HTSinsert(SupportComponentBase if BASE_AVAILABLE else object):
         lc_dp = dp.getH() / 10.0
         
         # Single pancake
-        lc_pancake = dp.pancake.getH() / 10.0
+        lc_pancake = pancake.getH() / 10.0
         
         # Isolation within double pancake
-        lc_dp_iso = dp.isolation.getH() / 3.0 if dp.isolation else 0.3
+        dp_iso = dp.isolation
+        lc_dp_iso = dp_iso.getH() / 3.0 if dp_iso else 0.3
         
         # Mandrel region
-        mandrel_gap = abs(dp.pancake.getMandrin() - dp.pancake.getR0())
+        mandrel_gap = abs(pancake.getMandrin() - pancake.getR0())
         lc_mandrel = mandrel_gap / 3.0 if mandrel_gap > 0 else 0.5
         
         # Superconductor tape
-        lc_sc = dp.pancake.tape.getW_Sc() / 5.0
+        lc_sc = tape.getW_Sc() / 5.0
         
         # Tape insulation
-        lc_tape_iso = max(dp.pancake.tape.getW_Isolation() / 3.0, 0.1)
+        lc_tape_iso = max(tape.getW_Isolation() / 3.0, 0.1)
         
         return (lc_iso, lc_dp, lc_pancake, lc_dp_iso, lc_mandrel, lc_sc, lc_tape_iso)
     
@@ -355,26 +430,31 @@ class HTSinsert(SupportComponentBase if BASE_AVAILABLE else object):
             if debug:
                 print("HTSinsert configuration data:", list(data.keys()))
         
-        # Load base definitions
-        base_tape = Tape()
+        # Load base definitions (defaults are only built when missing)
         if "tape" in data:
             base_tape = Tape.from_dict(data["tape"], debug=debug)
+        else:
+            base_tape = Tape()
         
-        base_pancake = Pancake()
         if "pancake" in data:
             base_pancake = Pancake.from_dict(data["pancake"], debug=debug)
             if debug:
                 print(f"Base pancake: {base_pancake}")
+        else:
+            base_pancake = Pancake()
         
-        base_isolation = Isolation()
         if "isolation" in data:
             base_isolation = Isolation.from_dict(data["isolation"], debug=debug)
+        else:
+            base_isolation = Isolation()
         
         # Initialize geometry parameters
-        z = 0.0
-        r0 = r1 = z0 = z1 = h = 0.0
+        r0 = r1 = z0 = 0.0
         n = 0
-        dblpancakes = []
+        # (pancake, isolation) and height of each double pancake, bottom
+        # to top; heights are those DblPancake.getH() will return
+        components = []
+        dp_heights = []
         isolations = []
         
         if "dblpancakes" in data:
@@ -391,21 +471,13 @@ class HTSinsert(SupportComponentBase if BASE_AVAILABLE else object):
                 if "isolation" in dp_config:
                     dp_isolation = Isolation.from_dict(dp_config["isolation"], debug=debug)
                 
-                # Create uniform double pancakes
-                for i in range(n):
-                    dp = DblPancake(z, base_pancake, base_isolation)
-                    dblpancakes.append(dp)
-                    
-                    if i < n - 1:  # Not the last one
-                        isolations.append(dp_isolation)
-                    
-                    z += dp.getH()
-                    if i < n - 1:
-                        z += dp_isolation.getH()
-                
-                h = z
-                r0 = dblpancakes[0].getR0() if dblpancakes else 0.0
-                r1 = dblpancakes[0].getR1() if dblpancakes else 0.0
+                # All identical: one shared template, one height
+                components = [(base_pancake, base_isolation)] * n
+                dp_heights = [2.0 * base_pancake.getH() + base_isolation.getH()] * n
+                isolations = [dp_isolation] * (n - 1) if n > 1 else []
+                if n > 0:
+                    r0 = base_pancake.getR0()
+                    r1 = base_pancake.getR1()
                 
             else:
                 # Variable double pancakes
@@ -430,38 +502,32 @@ class HTSinsert(SupportComponentBase if BASE_AVAILABLE else object):
                     else:
                         isolation = base_isolation
                     
-                    dp = DblPancake(z, pancake, isolation)
-                    dblpancakes.append(dp)
+                    components.append((pancake, isolation))
+                    dp_heights.append(2.0 * pancake.getH() + isolation.getH())
                     
                     # Update geometry bounds
                     if i == 0:
-                        r0 = dp.getR0()
-                        r1 = dp.getR1()
+                        r0 = pancake.getR0()
+                        r1 = pancake.getR1()
                     else:
-                        r0 = min(r0, dp.getR0())
-                        r1 = max(r1, dp.getR1())
-                    
-                    z += dp.getH()
+                        r0 = min(r0, pancake.getR0())
+                        r1 = max(r1, pancake.getR1())
                     
                     # Add isolation between DPs
                     if i < n - 1:
                         isolations.append(base_isolation)
-                        z += base_isolation.getH()
-                
-                h = z
         
-        # Calculate final positions
-        z1 = z0 - h / 2.0
-        z_current = z1
+        # Total height
+        iso_heights = [iso.getH() for iso in isolations]
+        _, h = _dp_bottoms(0.0, dp_heights, iso_heights)
         
-        # Update double pancake positions
-        for i, dp in enumerate(dblpancakes):
-            dp_height = dp.getH()
-            dp.setZ0(z_current + dp_height / 2.0)
-            z_current += dp_height
-            
-            if i < len(isolations):
-                z_current += isolations[i].getH()
+        # Create double pancakes at their final positions
+        z1 = z0 - h / 2.0
+        bottoms, _ = _dp_bottoms(z1, dp_heights, iso_heights)
+        dblpancakes = [
+            DblPancake(z_bottom + dp_height / 2.0, pancake, isolation)
+            for z_bottom, dp_height, (pancake, isolation) in zip(bottoms, dp_heights, components)
+        ]
         
         if debug:
             print("=== HTSinsert geometry loaded ===")
@@ -503,18 +569,16 @@ class HTSinsert(SupportComponentBase if BASE_AVAILABLE else object):
         n = data.get("n", 0)
         
         # Load double pancakes
-        dblpancakes = []
-        if "dblpancakes" in data:
-            for dp_data in data["dblpancakes"]:
-                dp = DblPancake.from_dict(dp_data, debug=debug)
-                dblpancakes.append(dp)
+        dblpancakes = [
+            DblPancake.from_dict(dp_data, debug=debug)
+            for dp_data in data.get("dblpancakes", ())
+        ]
         
         # Load isolations
-        isolations = []
-        if "isolations" in data:
-            for iso_data in data["isolations"]:
-                isolation = Isolation.from_dict(iso_data, debug=debug)
-                isolations.append(isolation)
+        isolations = [
+            Isolation.from_dict(iso_data, debug=debug)
+            for iso_data in data.get("isolations", ())
+        ]
         
         return cls(name, z0, h, r0, r1, z1, n, dblpancakes, isolations)
     
@@ -545,7 +609,7 @@ class HTSinsert(SupportComponentBase if BASE_AVAILABLE else object):
         msg += f"  Center position: z = {self.z0:.1f} mm\n"
         msg += f"  Double pancakes: {len(self.dblpancakes)}\n"
         
-        total_tapes = sum(self.getNtapes())
+        total_tapes = sum(self._tape_columns()["ntapes"])
         if total_tapes > 0:
             msg += f"  Total tape turns: {total_tapes}\n"
         
@@ -33,6 +33,8 @@ class Tape(SupportComponentBase if BASE_AVAILABLE else object):
         e: Thickness of co-wound insulation (mm)
     """
     
+    __slots__ = ("name", "w", "h", "e")
+
     yaml_tag = "!Tape"
     
     def __init__(self, w: float = 0, h: float = 0, e: float = 0) -> None:
@@ -51,7 +53,10 @@ class Tape(SupportComponentBase if BASE_AVAILABLE else object):
         self.h = float(h)
         self.e = float(e)
         
-        self.validate()
+        if BASE_AVAILABLE:
+            self._validate_after_init()
+        else:
+            self.validate()
     
     def validate(self) -> None:
         """Validate tape geometric parameters"""
@@ -136,25 +141,29 @@ class Tape(SupportComponentBase if BASE_AVAILABLE else object):
             List of [x, y] points defining tape outline
         """
         half_height = self.h / 2.0
+        y_bottom = center_y - half_height
+        y_top = center_y + half_height
+        w = self.w
         
         if self.e > 0:
             # Tape with insulation - create layered rectangle
+            w_total = w + self.e
             points = [
-                [0, center_y - half_height],           # Bottom left
-                [self.w, center_y - half_height],      # SC bottom right
-                [self.w, center_y + half_height],      # SC top right
-                [self.w + self.e, center_y + half_height], # Insulation top right
-                [self.w + self.e, center_y - half_height], # Insulation bottom right  
-                [0, center_y - half_height]            # Close shape
+                [0, y_bottom],          # Bottom left
+                [w, y_bottom],          # SC bottom right
+                [w, y_top],             # SC top right
+                [w_total, y_top],       # Insulation top right
+                [w_total, y_bottom],    # Insulation bottom right
+                [0, y_bottom]           # Close shape
             ]
         else:
             # Simple rectangle for SC only
             points = [
-                [0, center_y - half_height],
-                [self.w, center_y - half_height],
-                [self.w, center_y + half_height],
-                [0, center_y + half_height],
-                [0, center_y - half_height]
+                [0, y_bottom],
+                [w, y_bottom],
+                [w, y_top],
+                [0, y_top],
+                [0, y_bottom]
             ]
         
         return points
@@ -280,9 +289,9 @@ def create_tape_from_spec(tape_type: str, **kwargs) -> Tape:
     Returns:
         Tape instance
     """
-    if tape_type not in TAPE_FACTORIES:
+    factory = TAPE_FACTORIES.get(tape_type)
+    if factory is None:
         raise ValueError(f"Unknown tape type '{tape_type}'. "
                         f"Available types: {list(TAPE_FACTORIES.keys())}")
     
-    factory = TAPE_FACTORIES[tape_type]
     return factory(**kwargs)
@@ -10,9 +10,7 @@ This package contains the main magnetic field-generating components:
 - Supra: Superconducting magnets with detailed structure
 """
 
-from .helix import Helix
-from .bitter import Bitter
-from .supra import Supra
+from ...utils.registry import LazyRegistry
 
 __all__ = ['Helix', 'Bitter', 'Supra']
 
@@ -20,20 +18,37 @@ __all__ = ['Helix', 'Bitter', 'Supra']
 __version__ = "0.1.0"
 __author__ = "MagnetGeo Development Team"
 
+_HELIX = (f"{__name__}.helix", "Helix")
+_BITTER = (f"{__name__}.bitter", "Bitter")
+_SUPRA = (f"{__name__}.supra", "Supra")
+
 # Magnet class registry for dynamic loading
-MAGNET_CLASSES = {
-    "Helix": Helix,
-    "Bitter": Bitter,
-    "Supra": Supra,
-}
+MAGNET_CLASSES = LazyRegistry({
+    "Helix": _HELIX,
+    "Bitter": _BITTER,
+    "Supra": _SUPRA,
+})
 
 # Type mapping for YAML/JSON loading
-MAGNET_TYPE_MAP = {
-    "HL": Helix,  # Low resistance helix
-    "HR": Helix,  # High resistance helix
-    "Bitter": Bitter,
-    "Supra": Supra,
-}
+MAGNET_TYPE_MAP = LazyRegistry({
+    "HL": _HELIX,  # Low resistance helix
+    "HR": _HELIX,  # High resistance helix
+    "Bitter": _BITTER,
+    "Supra": _SUPRA,
+})
+
+
+def __getattr__(name: str):
+    """Import magnet classes on first access"""
+    if name not in MAGNET_CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = MAGNET_CLASSES[name]
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(MAGNET_CLASSES))
 
 
 def get_magnet_class(class_name: str):
@@ -95,9 +110,12 @@ def create_magnet(class_name: str, data: dict, debug: bool = False):
         Created magnet object or None if class not found
     """
     cls = get_magnet_class(class_name)
-    if cls and hasattr(cls, 'from_dict'):
-        return cls.from_dict(data, debug=debug)
-    elif cls:
+    if cls is None:
+        return None
+
+    try:
+        from_dict = cls.from_dict
+    except AttributeError:
         # Try direct construction
         try:
             return cls(**data)
@@ -105,7 +123,7 @@ def create_magnet(class_name: str, data: dict, debug: bool = False):
             if debug:
                 print(f"Failed to create {class_name}: {e}")
             return None
-    return None
+    return from_dict(data, debug=debug)
 
 
 def create_magnet_by_type(magnet_type: str, data: dict, debug: bool = False):
@@ -121,16 +139,19 @@ def create_magnet_by_type(magnet_type: str, data: dict, debug: bool = False):
         Created magnet object or None if type not found
     """
     cls = get_magnet_class_by_type(magnet_type)
-    if cls and hasattr(cls, 'from_dict'):
-        return cls.from_dict(data, debug=debug)
-    elif cls:
+    if cls is None:
+        return None
+
+    try:
+        from_dict = cls.from_dict
+    except AttributeError:
         try:
             return cls(**data)
         except Exception as e:
             if debug:
                 print(f"Failed to create {magnet_type}: {e}")
             return None
-    return None
+    return from_dict(data, debug=debug)
 
 
 def get_package_info():
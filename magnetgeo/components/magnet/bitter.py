@@ -12,6 +12,7 @@ import json
 import yaml
 from functools import cached_property
 from typing import List, Optional, Any
+from ...yaml_compatibility import ensure_yaml_compatibility
 
 # Import base classes
 try:
@@ -45,6 +46,16 @@ except ImportError:
     VALIDATION_AVAILABLE = False
 
 
+# Defaults for optional Bitter fields when loading from dict/YAML
+_BITTER_DEFAULTS = {
+    "modelaxi": None,
+    "coolingslits": None,
+    "tierod": None,
+    "innerbore": 0,
+    "outerbore": 0,
+}
+
+
 class Bitter(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
     """
     Bitter magnet component with enhanced validation and lazy loading
@@ -102,8 +113,8 @@ class Bitter(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
         else:
             # Fallback initialization
             self.name = name
-            self.r = r.copy()
-            self.z = z.copy()
+            self.r = tuple(r)
+            self.z = tuple(z)
             self.odd = odd
             self.innerbore = innerbore
             self.outerbore = outerbore
@@ -197,6 +208,7 @@ class Bitter(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
         # If it's a string, assume it's a filename
         if isinstance(data, str):
             try:
+                ensure_yaml_compatibility()
                 with open(f"{data}.yaml", "r") as f:
                     yaml_data = yaml.load(f, Loader=yaml.FullLoader)
                     if isinstance(yaml_data, expected_class):
@@ -374,7 +386,7 @@ class Bitter(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
     
     def boundingBox(self) -> tuple:
         """Return bounding box as (r, z) tuple"""
-        return (self.r.copy(), self.z.copy())
+        return (tuple(self.r), tuple(self.z))
     
     def get_bounds(self) -> tuple:
         """Return geometric bounds (implements GeometryMixin if available)"""
@@ -391,11 +403,11 @@ class Bitter(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
         Returns:
             True if objects intersect, False otherwise
         """
-        # Check if rectangles overlap in both dimensions
-        r_overlap = self.r[0] < r[1] and r[0] < self.r[1]
-        z_overlap = self.z[0] < z[1] and z[0] < self.z[1]
-        
-        return r_overlap and z_overlap
+        # Check if rectangles overlap in both dimensions; the z test is
+        # skipped when the radial ranges are already disjoint
+        rb = self.r
+        zb = self.z
+        return rb[0] < r[1] and r[0] < rb[1] and zb[0] < z[1] and z[0] < zb[1]
     
     def get_params(self, workingDir: str = ".") -> tuple:
         """
@@ -566,23 +578,13 @@ class Bitter(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
         if debug:
             print(f"Creating Bitter from dict: {list(data.keys())}")
         
-        # Extract basic parameters
-        name = data["name"]
-        r = data["r"]
-        z = data["z"]
-        odd = data["odd"]
-        innerbore = data.get("innerbore", 0)
-        outerbore = data.get("outerbore", 0)
-        
-        # Extract support component data
-        modelaxi = data.get("modelaxi")
-        coolingslits = data.get("coolingslits", [])
-        tierod = data.get("tierod")
+        values = {**_BITTER_DEFAULTS, **data}
         
         return cls(
-            name=name, r=r, z=z, odd=odd, modelaxi=modelaxi,
-            coolingslits=coolingslits, tierod=tierod,
-            innerbore=innerbore, outerbore=outerbore
+            name=values["name"], r=values["r"], z=values["z"], odd=values["odd"],
+            modelaxi=values["modelaxi"], coolingslits=values["coolingslits"],
+            tierod=values["tierod"],
+            innerbore=values["innerbore"], outerbore=values["outerbore"]
         )
     
     def validate(self) -> None:
@@ -598,23 +600,12 @@ class Bitter(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
 
 def Bitter_constructor(loader, node):
     """YAML constructor for backward compatibility"""
-    values = loader.construct_mapping(node)
-    
-    # Extract required values
-    name = values["name"]
-    r = values["r"]
-    z = values["z"]
-    odd = values["odd"]
-    modelaxi = values["modelaxi"]
-    coolingslits = values["coolingslits"]
-    tierod = values["tierod"]
-    
-    # Optional values with defaults
-    innerbore = values.get("innerbore", 0)
-    outerbore = values.get("outerbore", 0)
+    values = {**_BITTER_DEFAULTS, **loader.construct_mapping(node)}
     
     return Bitter(
-        name, r, z, odd, modelaxi, coolingslits, tierod, innerbore, outerbore
+        values["name"], values["r"], values["z"], values["odd"],
+        values["modelaxi"], values["coolingslits"], values["tierod"],
+        values["innerbore"], values["outerbore"]
     )
 
 
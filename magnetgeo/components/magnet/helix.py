@@ -12,6 +12,7 @@ import json
 import yaml
 from functools import cached_property
 from typing import List, Optional, Any
+from ...yaml_compatibility import ensure_yaml_compatibility
 
 # Import base classes
 try:
@@ -68,7 +69,10 @@ class Helix(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
 
     def __setstate__(self, state):
         """Handle deserialization with lazy loading setup"""
-        self.__dict__.update(state)
+        if BASE_CLASS_AVAILABLE:
+            super().__setstate__(state)
+        else:
+            self.__dict__.update(state)
 
         # Ensure support component data attributes exist
         if not hasattr(self, "_chamfers_data"):
@@ -127,8 +131,8 @@ class Helix(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
         else:
             # Fallback initialization
             self.name = name
-            self.r = r.copy()
-            self.z = z.copy()
+            self.r = tuple(r)
+            self.z = tuple(z)
             self.odd = odd
             self.cutwidth = cutwidth
             self.dble = dble
@@ -251,6 +255,7 @@ class Helix(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
         # If it's a string, assume it's a filename
         if isinstance(data, str):
             try:
+                ensure_yaml_compatibility()
                 with open(f"{data}.yaml", "r") as f:
                     yaml_data = yaml.load(f, Loader=yaml.FullLoader)
                     if isinstance(yaml_data, expected_class):
@@ -406,7 +411,7 @@ class Helix(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
 
     def boundingBox(self) -> tuple:
         """Return bounding box as (r, z) tuple"""
-        return (self.r.copy(), self.z.copy())
+        return (tuple(self.r), tuple(self.z))
 
     def get_bounds(self) -> tuple:
         """Return geometric bounds (implements GeometryMixin if available)"""
@@ -12,6 +12,7 @@ import json
 import yaml
 from functools import cached_property
 from typing import List, Optional
+from ...yaml_compatibility import ensure_yaml_compatibility
 
 # Import base classes
 try:
@@ -50,6 +51,10 @@ except ImportError:
     VALIDATION_AVAILABLE = False
 
 
+# Defaults for optional Supra fields when loading from dict/YAML
+_SUPRA_DEFAULTS = {"n": 0, "struct": "", "detail": "None"}
+
+
 class Supra(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
     """
     Superconducting magnet component with enhanced validation and lazy loading
@@ -91,8 +96,8 @@ class Supra(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
         else:
             # Fallback initialization
             self.name = name
-            self.r = r.copy()
-            self.z = z.copy()
+            self.r = tuple(r)
+            self.z = tuple(z)
             self.n = n
             self.struct = struct
 
@@ -157,31 +162,37 @@ class Supra(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
             return
 
         changed = False
+        r = list(self.r)
+        z = list(self.z)
 
         # Update radial bounds
         struct_r0 = magnet.getR0() if hasattr(magnet, "getR0") else None
         struct_r1 = magnet.getR1() if hasattr(magnet, "getR1") else None
 
-        if struct_r0 is not None and self.r[0] != struct_r0:
+        if struct_r0 is not None and r[0] != struct_r0:
             changed = True
-            self.r[0] = struct_r0
+            r[0] = struct_r0
 
-        if struct_r1 is not None and self.r[1] != struct_r1:
+        if struct_r1 is not None and r[1] != struct_r1:
             changed = True
-            self.r[1] = struct_r1
+            r[1] = struct_r1
 
         # Update axial bounds
         if hasattr(magnet, "getZ0") and hasattr(magnet, "getH"):
             struct_z0 = magnet.getZ0() - magnet.getH() / 2.0
             struct_z1 = magnet.getZ0() + magnet.getH() / 2.0
 
-            if self.z[0] != struct_z0:
+            if z[0] != struct_z0:
                 changed = True
-                self.z[0] = struct_z0
+                z[0] = struct_z0
 
-            if self.z[1] != struct_z1:
+            if z[1] != struct_z1:
                 changed = True
-                self.z[1] = struct_z1
+                z[1] = struct_z1
+
+        # Bounds are stored as immutable pairs
+        self.r = tuple(r)
+        self.z = tuple(z)
 
         # Update turn count
         if hasattr(magnet, "getNtapes"):
@@ -314,7 +325,7 @@ class Supra(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
 
     def boundingBox(self) -> tuple:
         """Return bounding box as (r, z) tuple"""
-        return (self.r.copy(), self.z.copy())
+        return (tuple(self.r), tuple(self.z))
 
     def get_bounds(self) -> tuple:
         """Return geometric bounds (implements GeometryMixin if available)"""
@@ -355,8 +366,8 @@ class Supra(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
         """Get complete magnet data as dictionary"""
         data = {
             "name": self.name,
-            "r": self.r.copy(),
-            "z": self.z.copy(),
+            "r": list(self.r),
+            "z": list(self.z),
             "n": self.n,
             "struct": self.struct,
             "detail": self.detail,
@@ -401,14 +412,18 @@ class Supra(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
     def load(self):
         """Load supra magnet from YAML file"""
         try:
+            ensure_yaml_compatibility()
             with open(f"{self.name}.yaml", "r") as istream:
                 data = yaml.load(stream=istream, Loader=yaml.FullLoader)
         except Exception:
             raise Exception(f"Failed to load Supra data {self.name}.yaml")
 
         self.name = data.name
-        self.r = data.r
-        self.z = data.z
+        if BASE_CLASS_AVAILABLE:
+            self.set_bounds(data.r, data.z)
+        else:
+            self.r = data.r
+            self.z = data.z
         self.n = data.n
         self.struct = data.struct
         self.detail = getattr(data, "detail", "None")
@@ -465,18 +480,13 @@ class Supra(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
         if debug:
             print(f"Creating Supra from dict: {list(data.keys())}")
 
-        # Extract basic parameters
-        name = data["name"]
-        r = data["r"]
-        z = data["z"]
-        n = data.get("n", 0)
-        struct = data.get("struct", "")
-
-        supra = cls(name=name, r=r, z=z, n=n, struct=struct)
+        values = {**_SUPRA_DEFAULTS, **data}
 
-        # Set detail level if provided
-        detail = data.get("detail", "None")
-        supra.set_Detail(detail)
+        supra = cls(
+            name=values["name"], r=values["r"], z=values["z"],
+            n=values["n"], struct=values["struct"]
+        )
+        supra.set_Detail(values["detail"])
 
         return supra
 
@@ -523,20 +533,10 @@ class Supra(MagnetComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject):
 
 def Supra_constructor(loader, node):
     """YAML constructor for backward compatibility"""
-    values = loader.construct_mapping(node)
-
-    # Extract required values
-    name = values["name"]
-    r = values["r"]
-    z = values["z"]
-    n = values["n"]
-    struct = values["struct"]
+    values = {**_SUPRA_DEFAULTS, **loader.construct_mapping(node)}
 
-    supra = Supra(name, r, z, n, struct)
-
-    # Set detail level if provided
-    if "detail" in values:
-        supra.set_Detail(values["detail"])
+    supra = Supra(values["name"], values["r"], values["z"], values["n"], values["struct"])
+    supra.set_Detail(values["detail"])
 
     return supra
 
@@ -8,9 +8,28 @@ This module contains structural components that provide physical support
 and electrical connections in magnet assemblies.
 """
 
-from .ring import Ring
-from .screen import Screen
-from .innercurrentlead import InnerCurrentLead
-from .outercurrentlead import OuterCurrentLead
+import importlib
+
+# Public class -> submodule providing it, imported on first access
+_LAZY = {
+    "Ring": ".ring",
+    "Screen": ".screen",
+    "InnerCurrentLead": ".innercurrentlead",
+    "OuterCurrentLead": ".outercurrentlead",
+}
 
 __all__ = ["Ring", "Screen", "InnerCurrentLead", "OuterCurrentLead"]
+
+
+def __getattr__(name: str):
+    """Import structural components on first access"""
+    rel = _LAZY.get(name)
+    if rel is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(rel, __name__), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
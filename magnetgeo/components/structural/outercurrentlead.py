@@ -8,6 +8,7 @@ Provides OuterCurrentLead class for structural components
 import json
 import yaml
 from typing import List
+from ...yaml_compatibility import ensure_yaml_compatibility
 
 try:
     from ...base.structural_base import StructuralComponentBase
@@ -133,13 +134,17 @@ class OuterCurrentLead(StructuralComponentBase if BASE_CLASS_AVAILABLE else yaml
     def load(self):
         """Load object from YAML file"""
         try:
+            ensure_yaml_compatibility()
             with open(f"{self.name}.yaml", "r") as istream:
                 data = yaml.load(stream=istream, Loader=yaml.FullLoader)
         except Exception:
             raise Exception(f"Failed to load OuterCurrentLead data {self.name}.yaml")
 
         self.name = data.name
-        self.r = data.r
+        if BASE_CLASS_AVAILABLE:
+            self.set_bounds(data.r)
+        else:
+            self.r = data.r
         self.h = data.h
         self.bar = data.bar
         self.support = data.support
@@ -8,6 +8,7 @@ Provides Ring class for structural components
 import json
 import yaml
 from typing import List, Optional
+from ...yaml_compatibility import ensure_yaml_compatibility
 
 try:
     from ...base.structural_base import StructuralComponentBase
@@ -40,7 +41,10 @@ class Ring(StructuralComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject)
         This method is called during deserialization (when loading from YAML or pickle)
         We use it to ensure the optional attributes always exist
         """
-        self.__dict__.update(state)
+        if BASE_CLASS_AVAILABLE:
+            super().__setstate__(state)
+        else:
+            self.__dict__.update(state)
         
         # Ensure these attributes always exist
         if not hasattr(self, 'cad'):
@@ -168,14 +172,18 @@ class Ring(StructuralComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObject)
     def load(self):
         """Load object from YAML file"""
         try:
+            ensure_yaml_compatibility()
             with open(f"{self.name}.yaml", "r") as istream:
                 data = yaml.load(stream=istream, Loader=yaml.FullLoader)
         except Exception:
             raise Exception(f"Failed to load Ring data {self.name}.yaml")
 
         self.name = data.name
-        self.r = data.r
-        self.z = data.z
+        if BASE_CLASS_AVAILABLE:
+            self.set_bounds(data.r, data.z)
+        else:
+            self.r = data.r
+            self.z = data.z
         self.n = data.n
         self.angle = data.angle
         self.BPside = data.BPside
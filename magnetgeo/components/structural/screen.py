@@ -8,6 +8,7 @@ Provides Screen class for structural components
 import json
 import yaml
 from typing import List
+from ...yaml_compatibility import ensure_yaml_compatibility
 
 try:
     from ...base.structural_base import StructuralComponentBase
@@ -122,14 +123,18 @@ class Screen(StructuralComponentBase if BASE_CLASS_AVAILABLE else yaml.YAMLObjec
     def load(self):
         """Load object from YAML file"""
         try:
+            ensure_yaml_compatibility()
             with open(f"{self.name}.yaml", "r") as istream:
                 data = yaml.load(stream=istream, Loader=yaml.FullLoader)
         except Exception:
             raise Exception(f"Failed to load Screen data {self.name}.yaml")
 
         self.name = data.name
-        self.r = data.r
-        self.z = data.z
+        if BASE_CLASS_AVAILABLE:
+            self.set_bounds(data.r, data.z)
+        else:
+            self.r = data.r
+            self.z = data.z
 
     def to_json(self) -> str:
         """Convert to JSON string"""
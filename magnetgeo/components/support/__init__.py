@@ -8,58 +8,42 @@ This module contains refactored support components that inherit from
 SupportComponentBase and provide enhanced validation and type safety.
 """
 
-from .chamfer import Chamfer
-from .groove import Groove
-from .model3d import Model3D
-from .modelaxi import ModelAxi
-from .coolingslit import CoolingSlit
-from .tierod import Tierod
-
-# Import Shape if it exists
-try:
-    from .shape import Shape
-    __all__ = [
-        'Chamfer', 'Groove', 'Model3D', 'ModelAxi', 
-        'CoolingSlit', 'Tierod', 'Shape'
-    ]
-except ImportError:
-    # Shape not yet refactored
-    __all__ = [
-        'Chamfer', 'Groove', 'Model3D', 'ModelAxi', 
-        'CoolingSlit', 'Tierod'
-    ]
-
-# Import Shape2D if it exists
-try:
-    from .shape2d import Shape2D
-    __all__.append('Shape2D')
-except ImportError:
-    pass
+from ...utils.registry import LazyRegistry
+
+__all__ = [
+    'Chamfer', 'Groove', 'Model3D', 'ModelAxi', 
+    'CoolingSlit', 'Tierod', 'Shape', 'Shape2D'
+]
 
 # Version info
 __version__ = "0.1.0"
 __author__ = "MagnetGeo Development Team"
 
-# Support class registry for dynamic loading
-SUPPORT_CLASSES = {
-    "Chamfer": Chamfer,
-    "Groove": Groove,
-    "Model3D": Model3D,
-    "ModelAxi": ModelAxi,
-    "CoolingSlit": CoolingSlit,
-    "Tierod": Tierod,
-}
+# Support class registry for dynamic loading; classes are imported on
+# first lookup
+SUPPORT_CLASSES = LazyRegistry({
+    "Chamfer": (f"{__name__}.chamfer", "Chamfer"),
+    "Groove": (f"{__name__}.groove", "Groove"),
+    "Model3D": (f"{__name__}.model3d", "Model3D"),
+    "ModelAxi": (f"{__name__}.modelaxi", "ModelAxi"),
+    "CoolingSlit": (f"{__name__}.coolingslit", "CoolingSlit"),
+    "Tierod": (f"{__name__}.tierod", "Tierod"),
+    "Shape": (f"{__name__}.shape", "Shape"),
+    "Shape2D": (f"{__name__}.shape2d", "Shape2D"),
+})
+
+
+def __getattr__(name: str):
+    """Import support classes on first access"""
+    if name not in SUPPORT_CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = SUPPORT_CLASSES[name]
+    globals()[name] = obj
+    return obj
 
-# Add Shape classes if available
-try:
-    SUPPORT_CLASSES["Shape"] = Shape
-except NameError:
-    pass
 
-try:
-    SUPPORT_CLASSES["Shape2D"] = Shape2D
-except NameError:
-    pass
+def __dir__():
+    return sorted(set(globals()) | set(SUPPORT_CLASSES))
 
 
 def get_support_class(class_name: str):
@@ -98,6 +82,10 @@ def create_support_object(class_name: str, data: dict, debug: bool = False):
         Created support object or None if class not found
     """
     cls = get_support_class(class_name)
-    if cls and hasattr(cls, 'from_dict'):
-        return cls.from_dict(data, debug=debug)
-    return None
+    if cls is None:
+        return None
+    try:
+        from_dict = cls.from_dict
+    except AttributeError:
+        return None
+    return from_dict(data, debug=debug)
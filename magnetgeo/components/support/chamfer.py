@@ -55,7 +55,7 @@ class Chamfer(SupportComponentBase):
         self.l = l
         
         # Call validation after setting all attributes
-        self.validate()
+        self._validate_after_init()
     
     def validate(self) -> None:
         """Validate chamfer parameters"""
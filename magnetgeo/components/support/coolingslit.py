@@ -63,7 +63,7 @@ class CoolingSlit(SupportComponentBase):
         self._shape_data = shape
 
         # Call validation after setting all attributes
-        self.validate()
+        self._validate_after_init()
 
     def validate(self) -> None:
         """Validate cooling slit parameters"""
@@ -49,7 +49,7 @@ class Groove(SupportComponentBase):
         self.eps = eps
         
         # Call validation after setting all attributes
-        self.validate()
+        self._validate_after_init()
     
     def validate(self) -> None:
         """Validate groove parameters"""
@@ -47,7 +47,7 @@ class Model3D(SupportComponentBase):
         self.with_channels = with_channels
         
         # Call validation after setting all attributes
-        self.validate()
+        self._validate_after_init()
     
     def validate(self) -> None:
         """Validate 3D model parameters"""
@@ -48,7 +48,7 @@ class ModelAxi(SupportComponentBase):
         self.pitch = pitch or []
         
         # Call validation after setting all attributes
-        self.validate()
+        self._validate_after_init()
     
     def validate(self) -> None:
         """Validate model parameters"""
@@ -64,7 +64,7 @@ class Probe(SupportComponentBase):
         self.accuracy = accuracy
         
         # Call validation after setting all attributes
-        self.validate()
+        self._validate_after_init()
     
     def validate(self) -> None:
         """Validate probe parameters"""
@@ -57,7 +57,7 @@ class Shape(SupportComponentBase):
         self.position = position
         
         # Call validation after setting all attributes
-        self.validate()
+        self._validate_after_init()
     
     def validate(self) -> None:
         """Validate shape parameters"""
@@ -37,7 +37,7 @@ class Shape2D(SupportComponentBase):
         self.pts = pts or []
         
         # Call validation after setting all attributes
-        self.validate()
+        self._validate_after_init()
     
     def validate(self) -> None:
         """Validate 2D shape parameters"""
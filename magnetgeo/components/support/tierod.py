@@ -58,7 +58,7 @@ class Tierod(SupportComponentBase):
         self._shape_data = shape
 
         # Call validation after setting all attributes
-        self.validate()
+        self._validate_after_init()
 
     def validate(self) -> None:
         """Validate tie rod parameters"""
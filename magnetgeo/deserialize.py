@@ -99,7 +99,14 @@ def serialize_instance(obj: Any) -> Dict[str, Any]:
         Dictionary with class name and object attributes
     """
     d = {"__classname__": type(obj).__name__}
-    d.update(vars(obj))
+    # Our __getstate__ leaves out derived caches kept on the instance.
+    # object.__getstate__ is missing before Python 3.11 and may return
+    # None or a (dict, slots) tuple since, so anything else uses vars().
+    getstate = getattr(obj, "__getstate__", None)
+    state = getstate() if getstate is not None else None
+    if not isinstance(state, dict):
+        state = vars(obj)
+    d.update(state)
     return d
 
 
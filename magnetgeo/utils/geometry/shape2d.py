@@ -12,6 +12,7 @@ import yaml
 import json
 import math
 from typing import Dict, Any, List, Tuple, Optional
+from ...yaml_compatibility import ensure_yaml_compatibility
 
 # Try to import validation utilities
 try:
@@ -89,6 +90,7 @@ class Shape2D(yaml.YAMLObject):
     def load(self, name: str):
         """Load object from YAML file"""
         try:
+            ensure_yaml_compatibility()
             with open(f"{name}.yaml", "r") as istream:
                 data = yaml.load(stream=istream, Loader=yaml.FullLoader)
         except Exception as e:
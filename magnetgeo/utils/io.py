@@ -12,6 +12,7 @@ import os
 import yaml
 import json
 from typing import Any, Dict, Type, Union, Optional
+from ..yaml_compatibility import ensure_yaml_compatibility
 from pathlib import Path
 
 
@@ -41,6 +42,7 @@ def load_file(filepath: str, expected_class: Optional[Type] = None, debug: bool
         print(f"Loading file: {filepath} (expected: {expected_class})")
     
     try:
+        ensure_yaml_compatibility()
         with open(filepath, 'r') as f:
             if extension == '.yaml' or extension == '.yml':
                 data = yaml.load(f, Loader=yaml.FullLoader)
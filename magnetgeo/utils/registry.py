@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Lazy class registries
+
+Package registries map class names to classes. Referencing the classes
+directly would import every component module with the package, so the
+registries here only record where each class lives and import it on
+first lookup.
+"""
+
+import importlib
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Tuple
+
+
+class LazyRegistry(Mapping):
+    """
+    Read-only name -> class mapping that imports classes on first lookup
+
+    Iteration, len() and membership tests only use the specification and
+    never import anything.
+    """
+
+    def __init__(self, spec: Dict[str, Tuple[str, str]]):
+        """
+        Initialize registry
+
+        Args:
+            spec: Mapping of registry key to (module path, attribute name)
+        """
+        self._spec = dict(spec)
+        self._cache: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        module_path, attr = self._spec[key]
+        obj = getattr(importlib.import_module(module_path), attr)
+        self._cache[key] = obj
+        return obj
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Return the class registered under key, or default
+
+        Already-resolved classes are a single dict probe, without going
+        through Mapping.get() and __getitem__().
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        if key not in self._spec:
+            return default
+        return self[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._spec
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spec)
+
+    def __len__(self) -> int:
+        return len(self._spec)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._spec)!r})"
@@ -6,6 +6,7 @@ Enhanced YAML compatibility system for magnetgeo with structural components
 """
 
 import yaml
+from functools import cache
 from typing import Dict, Any, Type, List
 
 
@@ -176,6 +177,9 @@ class YAMLCompatibilityManager:
 # Global YAML compatibility manager
 yaml_manager = YAMLCompatibilityManager()
 
+# Set once YAML constructors have been registered (see ensure_yaml_compatibility)
+_YAML_READY = False
+
 
 def setup_yaml_compatibility():
     """Set up YAML compatibility for all classes"""
@@ -185,6 +189,20 @@ def setup_yaml_compatibility():
     print("YAML compatibility setup complete")
 
 
+def ensure_yaml_compatibility():
+    """
+    Set up YAML compatibility on first use
+
+    Registering the constructors imports every component package, so it is
+    deferred until something actually loads YAML.
+    """
+    global _YAML_READY
+    if not _YAML_READY:
+        _YAML_READY = True
+        setup_yaml_compatibility()
+        setup_custom_extractors()
+
+
 def setup_custom_extractors():
     """Set up custom extractors for complex classes"""
     # This function can be extended to handle special cases
@@ -205,6 +223,7 @@ def load_yaml_file(filepath: str, debug: bool = False):
         Loaded object
     """
     try:
+        ensure_yaml_compatibility()
         with open(filepath, 'r') as f:
             return yaml.load(f, Loader=yaml.FullLoader)
     except Exception as e:
@@ -246,6 +265,32 @@ def get_yaml_tag_info() -> Dict[str, str]:
     }
 
 
+@cache
+def _round_trip_test():
+    """
+    Dump and reload a Ring through YAML
+
+    The result cannot change once the constructors are registered, so it
+    is computed once.
+
+    Returns:
+        True if the round trip preserves the object, otherwise False or
+        a failure message
+    """
+    try:
+        from .components.structural import Ring
+        test_ring = Ring("test", [10.0, 20.0], [0.0, 100.0])
+        yaml_str = yaml.dump(test_ring)
+        loaded_ring = yaml.load(yaml_str, Loader=yaml.FullLoader)
+        return (
+            loaded_ring.name == test_ring.name and
+            loaded_ring.r == test_ring.r and
+            loaded_ring.z == test_ring.z
+        )
+    except Exception as e:
+        return f"Failed: {e}"
+
+
 def validate_yaml_compatibility():
     """
     Validate that YAML compatibility is working correctly
@@ -253,6 +298,7 @@ def validate_yaml_compatibility():
     Returns:
         Dictionary with validation results
     """
+    ensure_yaml_compatibility()
     results = {
         'registered_classes': len(yaml_manager.registered_classes),
         'class_aliases': len(yaml_manager.class_aliases),
@@ -260,18 +306,7 @@ def validate_yaml_compatibility():
     }
     
     # Test a simple round-trip if possible
-    try:
-        from .components.structural import Ring
-        test_ring = Ring("test", [10.0, 20.0], [0.0, 100.0])
-        yaml_str = yaml.dump(test_ring)
-        loaded_ring = yaml.load(yaml_str, Loader=yaml.FullLoader)
-        results['round_trip_test'] = (
-            loaded_ring.name == test_ring.name and
-            loaded_ring.r == test_ring.r and
-            loaded_ring.z == test_ring.z
-        )
-    except Exception as e:
-        results['round_trip_test'] = f"Failed: {e}"
+    results['round_trip_test'] = _round_trip_test()
     
     return results
 
@@ -279,7 +314,7 @@ def validate_yaml_compatibility():
 if __name__ == "__main__":
     """Test the YAML compatibility system"""
     print("Testing YAML compatibility system...")
-    setup_yaml_compatibility()
+    ensure_yaml_compatibility()
     
     results = validate_yaml_compatibility()
     print("\nValidation results:")
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Tests for collection geometry operations, component bounds and lazy
+class registries
+"""
+
+import importlib
+import pickle
+import random
+
+import pytest
+import yaml
+
+from magnetgeo.base.geometry import CollectionGeometryMixin, GeometryMixin
+from magnetgeo.utils.registry import LazyRegistry
+
+
+class Box(GeometryMixin):
+    """Rectangle in the r-z plane"""
+
+    def __init__(self, name, r, z):
+        self.name = name
+        self.r = tuple(r)
+        self.z = tuple(z)
+
+    def get_bounds(self):
+        return (self.r, self.z)
+
+
+class Collection(CollectionGeometryMixin):
+    """Collection over a fixed list of objects"""
+
+    def __init__(self, objects):
+        self.objects = objects
+
+    def get_objects(self):
+        return self.objects
+
+
+def pairwise_overlaps(objects, tolerance=1e-6):
+    """Reference all-pairs scan find_overlapping_objects must agree with"""
+    pairs = []
+    for i, obj1 in enumerate(objects):
+        for obj2 in objects[i + 1:]:
+            r1, z1 = obj1.get_bounds()
+            r2, z2 = obj2.get_bounds()
+            r_overlap = max(0, min(r1[1], r2[1]) - max(r1[0], r2[0]))
+            z_overlap = max(0, min(z1[1], z2[1]) - max(z1[0], z2[0]))
+            if r_overlap > tolerance and z_overlap > tolerance:
+                pairs.append((obj1, obj2))
+    return pairs
+
+
+def random_boxes(rng, n, grid):
+    """
+    Random boxes; on a grid, many of them touch or coincide exactly
+    """
+    boxes = []
+    for i in range(n):
+        if grid:
+            r0 = float(rng.randint(0, 10))
+            z0 = float(rng.randint(0, 10))
+            dr = float(rng.randint(1, 4))
+            dz = float(rng.randint(1, 4))
+        else:
+            r0 = rng.uniform(0.0, 10.0)
+            z0 = rng.uniform(0.0, 10.0)
+            dr = rng.uniform(0.01, 4.0)
+            dz = rng.uniform(0.01, 4.0)
+        boxes.append(Box(f"b{i}", [r0, r0 + dr], [z0, z0 + dz]))
+    return boxes
+
+
+@pytest.mark.parametrize("grid", [False, True])
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 8, 50, 200])
+@pytest.mark.parametrize("seed", range(5))
+def test_find_overlapping_objects_matches_pairwise_scan(seed, n, grid):
+    boxes = random_boxes(random.Random(seed), n, grid)
+    assert Collection(boxes).find_overlapping_objects() == pairwise_overlaps(boxes)
+
+
+@pytest.mark.parametrize("tolerance", [0.0, 1e-6, 0.5, 2.0])
+def test_find_overlapping_objects_tolerance(tolerance):
+    boxes = random_boxes(random.Random(42), 100, grid=False)
+    result = Collection(boxes).find_overlapping_objects(tolerance)
+    assert result == pairwise_overlaps(boxes, tolerance)
+
+
+def test_touching_objects_do_not_overlap():
+    boxes = [
+        Box("a", [0.0, 1.0], [0.0, 1.0]),
+        Box("b", [1.0, 2.0], [0.0, 1.0]),
+        Box("c", [0.0, 1.0], [1.0, 2.0]),
+    ]
+    assert Collection(boxes).find_overlapping_objects() == []
+
+
+def make_ring():
+    from magnetgeo.components.structural import Ring
+
+    return Ring("r", [1.0, 2.0], [0.0, 1.0])
+
+
+def make_helix():
+    from magnetgeo.components.magnet import Helix
+
+    return Helix("h", [10.0, 20.0], [0.0, 50.0], 0.2, True, True, None, None, None)
+
+
+@pytest.mark.parametrize("make", [make_ring, make_helix])
+def test_bounds_follow_reassignment(make):
+    obj = make()
+    obj.r = (5.0, 6.0)
+    assert obj.get_bounds()[0] == (5.0, 6.0)
+
+    obj.set_bounds(z=[2.0, 3.0])
+    assert obj.get_bounds() == ((5.0, 6.0), (2.0, 3.0))
+    assert obj.intersect([5.5, 7.0], [2.5, 4.0])
+    assert not obj.intersect([0.0, 1.0], [2.5, 4.0])
+
+
+@pytest.mark.parametrize("make", [make_ring, make_helix])
+def test_round_trip_keeps_bounds_as_tuples(make):
+    obj = make()
+    for copy in (
+        pickle.loads(pickle.dumps(obj)),
+        yaml.load(yaml.dump(obj), Loader=yaml.UnsafeLoader),
+    ):
+        assert type(copy.r) is tuple and type(copy.z) is tuple
+        assert copy.get_bounds() == obj.get_bounds()
+
+
+def test_lazy_registry_imports_on_lookup():
+    registry = LazyRegistry({"Decimal": ("decimal", "Decimal")})
+    assert "Decimal" in registry and "Fraction" not in registry
+    assert list(registry) == ["Decimal"] and len(registry) == 1
+
+    cls = importlib.import_module("decimal").Decimal
+    assert registry["Decimal"] is cls
+    assert registry.get("Decimal") is cls
+    assert registry.get("Fraction", 0) == 0
+    with pytest.raises(KeyError):
+        registry["Fraction"]
+
+
+@pytest.mark.parametrize(
+    "package, registry",
+    [
+        ("magnetgeo.components.magnet", "MAGNET_CLASSES"),
+        ("magnetgeo.components.magnet", "MAGNET_TYPE_MAP"),
+        ("magnetgeo.components.support", "SUPPORT_CLASSES"),
+    ],
+)
+def test_component_registries_resolve(package, registry):
+    module = importlib.import_module(package)
+    for name, cls in getattr(module, registry).items():
+        assert isinstance(cls, type)
+        if name in module.__all__:
+            assert getattr(module, name) is cls
+
+
+@pytest.mark.parametrize(
+    "package",
+    ["magnetgeo.base", "magnetgeo.components.structural", "magnetgeo.components"],
+)
+def test_lazy_package_attributes_resolve(package):
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+    with pytest.raises(AttributeError):
+        getattr(module, "NoSuchComponent")
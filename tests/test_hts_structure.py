@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+Tests for HTS geometry: stacking, derived dimensions and serialization
+"""
+
+import importlib
+import json
+import pickle
+import random
+
+import pytest
+import yaml
+
+import magnetgeo.components.hts as hts
+from magnetgeo.components.hts import DblPancake, Isolation, Pancake, Tape, structure
+from magnetgeo.components.hts.factory import create_uniform_structure
+from magnetgeo.components.hts.structure import HTSinsert, _dp_bottoms
+
+
+def stacked_bottoms(z_start, dp_heights, iso_heights):
+    """Reference stacking: one addition per double pancake and isolation"""
+    bottoms = []
+    z = z_start
+    for i, dp_height in enumerate(dp_heights):
+        bottoms.append(z)
+        z += dp_height
+        if i < len(iso_heights):
+            z += iso_heights[i]
+    return bottoms, z
+
+
+def random_stack(seed, n):
+    rng = random.Random(seed)
+    dp_heights = [rng.uniform(1.0, 10.0) for _ in range(n)]
+    iso_heights = [rng.uniform(0.1, 1.0) for _ in range(max(n - 1, 0))]
+    return dp_heights, iso_heights
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 63, 64, 65, 200])
+@pytest.mark.parametrize("seed", range(3))
+def test_dp_bottoms_matches_stacking(seed, n):
+    dp_heights, iso_heights = random_stack(seed, n)
+    expected = stacked_bottoms(-3.3, dp_heights, iso_heights)
+    # Exact comparison: both paths must add in the same order
+    assert _dp_bottoms(-3.3, dp_heights, iso_heights) == expected
+
+
+@pytest.mark.parametrize("n", [64, 200])
+def test_dp_bottoms_numpy_and_loop_agree(monkeypatch, n):
+    pytest.importorskip("numpy")
+    dp_heights, iso_heights = random_stack(7, n)
+    vectorized = _dp_bottoms(1.5, dp_heights, iso_heights)
+    monkeypatch.setattr(structure, "_NUMPY_MIN_DBLPANCAKES", n + 1)
+    assert _dp_bottoms(1.5, dp_heights, iso_heights) == vectorized
+    assert all(type(z) is float for z in vectorized[0])
+
+
+@pytest.mark.parametrize("n", [1, 3, 100])
+def test_fromcfg_uniform_positions(tmp_path, n):
+    tape = {"w": 4, "h": 0.1, "e": 0.4}
+    config = {
+        "pancake": {"r0": 10, "mandrin": 9, "ntapes": 10, "tape": tape},
+        "isolation": {"r0": 10, "w": [44], "h": [0.2]},
+        "dblpancakes": {"n": n, "isolation": {"r0": 10, "w": [44], "h": [0.5]}},
+    }
+    filename = tmp_path / "insert.json"
+    filename.write_text(json.dumps(config))
+
+    insert = HTSinsert.fromcfg(str(filename))
+
+    dp_heights = [dp.getH() for dp in insert.dblpancakes]
+    iso_heights = [iso.getH() for iso in insert.isolations]
+    _, h = stacked_bottoms(0.0, dp_heights, iso_heights)
+    bottoms, _ = stacked_bottoms(-h / 2.0, dp_heights, iso_heights)
+    assert insert.h == h
+    assert insert.z1 == -h / 2.0
+    assert [dp.z0 for dp in insert.dblpancakes] == [
+        z + dp_height / 2.0 for z, dp_height in zip(bottoms, dp_heights)
+    ]
+
+
+def make_dblpancake():
+    tape = Tape(0.1, 4.0, 0.05)
+    pancake = Pancake(10.0, tape, 5, 9.0)
+    isolation = Isolation(10.0, [1.0], [0.2])
+    return DblPancake(0.0, pancake, isolation)
+
+
+def test_pancake_follows_tape_changes():
+    dp = make_dblpancake()
+    pancake = dp.pancake
+    assert pancake.getR1() == pytest.approx(10.75)
+    assert pancake.getR()[1] == pytest.approx(10.15)
+
+    pancake.tape.w = 1.0
+    assert pancake.getR1() == pytest.approx(15.25)
+    assert pancake.getR()[1] == pytest.approx(11.05)
+    assert pancake.getR1() == pickle.loads(pickle.dumps(pancake)).getR1()
+
+    pancake.tape.h = 8.0
+    assert pancake.getH() == 8.0
+    assert dp.getH() == pytest.approx(16.2)
+
+
+def test_dblpancake_follows_child_changes():
+    dp = make_dblpancake()
+    assert dp.getR1() == pytest.approx(10.75)
+
+    # In-place changes of the (possibly shared) children
+    dp.pancake.n = 20
+    assert dp.getR1() == pytest.approx(13.0)
+    assert dp.get_bounds()[0] == pytest.approx((10.0, 13.0))
+
+    dp.isolation.h = [2.0]
+    assert dp.getH() == pytest.approx(10.0)
+    assert dp.getZ2() == pytest.approx(5.0)
+
+    # Reassignment
+    dp.pancake = Pancake(10.0, Tape(0.1, 8.0, 0.05), 20, 9.0)
+    r_bounds, z_bounds = dp.get_bounds()
+    assert r_bounds == pytest.approx((10.0, 13.0))
+    assert z_bounds == pytest.approx((-9.0, 9.0))
+    dp.isolation = Isolation(10.0, [1.0], [0.0])
+    assert dp.getH() == pytest.approx(16.0)
+    assert dp.get_names("dp", "pancake") == ["dp_p0", "dp_p1"]
+
+
+def test_shared_pancake_changes_reach_every_dblpancake():
+    insert = create_uniform_structure("u", 10.0, 30.0, 40.0, 4)
+    shared = insert.dblpancakes[0].pancake
+    assert all(dp.pancake is shared for dp in insert.dblpancakes)
+
+    shared.n = shared.n + 10
+    r1 = shared.getR1()
+    assert [dp.getR1() for dp in insert.dblpancakes] == [r1] * 4
+
+
+def test_insert_tape_getters_follow_nested_changes():
+    insert = create_uniform_structure("u", 10.0, 30.0, 40.0, 4)
+    n_before = insert.getNtapes()[0]
+
+    # Pancakes are shared: one in-place change reaches every double pancake
+    insert.dblpancakes[0].pancake.n = 99
+    assert insert.getNtapes() == [198] * 4
+    assert n_before != 198
+
+    insert.dblpancakes[0].pancake.tape.h = 0.25
+    assert insert.getHtapes() == [0.25] * 4
+
+    insert.dblpancakes = insert.dblpancakes[:2]
+    assert insert.getNtapes() == [198, 198]
+    assert len(insert.getWtapes_SC()) == len(insert.getWtapes_Isolation()) == 2
+
+    # Returned lists belong to the caller
+    insert.getNtapes().append(1)
+    assert insert.getNtapes() == [198, 198]
+
+
+def test_isolation_follows_in_place_layer_changes():
+    isolation = Isolation(10.0, [1.0], [0.2])
+    assert isolation.getH() == pytest.approx(0.2)
+
+    isolation.h.append(0.3)
+    isolation.w.append(2.0)
+    assert isolation.getH() == pytest.approx(0.5)
+    assert isolation.getR1() == pytest.approx(12.0)
+    assert isolation.getArea() == pytest.approx(1.0)
+
+    isolation.h[:] = [0.0, 0.0]
+    assert isolation.is_empty()
+
+
+def make_hts_objects():
+    dp = make_dblpancake()
+    return [
+        dp.pancake.tape,
+        dp.pancake,
+        dp.isolation,
+        dp,
+        create_uniform_structure("u", 10.0, 30.0, 40.0, 4),
+    ]
+
+
+@pytest.mark.parametrize("index", range(5))
+def test_slotted_objects_round_trip(index):
+    obj = make_hts_objects()[index]
+    for copy in (
+        pickle.loads(pickle.dumps(obj)),
+        yaml.load(yaml.dump(obj), Loader=yaml.UnsafeLoader),
+    ):
+        assert type(copy) is type(obj)
+        assert copy.to_dict() == obj.to_dict()
+
+
+def test_unknown_yaml_field_on_slotted_object_is_ignored():
+    document = yaml.dump(Tape(0.1, 4.0, 0.05)) + "color: red\n"
+    with pytest.warns(UserWarning, match="color"):
+        tape = yaml.load(document, Loader=yaml.UnsafeLoader)
+    assert (tape.w, tape.h, tape.e) == (0.1, 4.0, 0.05)
+    assert not hasattr(tape, "color")
+
+
+def test_hts_registry_resolves():
+    for name in hts.list_hts_components():
+        cls = hts.get_hts_component(name)
+        assert getattr(hts, name) is cls
+        assert cls.__module__.startswith(hts.__name__)
+    assert hts.get_hts_component("Nope") is None
+    assert hts.create_uniform_structure is importlib.import_module(
+        "magnetgeo.components.hts.factory"
+    ).create_uniform_structure
+
+    tape = hts.create_hts_component("Tape", {"w": 1, "h": 2, "e": 3})
+    assert type(tape) is Tape and (tape.w, tape.h, tape.e) == (1.0, 2.0, 3.0)